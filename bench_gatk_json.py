@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+# Time each stage of wrapper generation on synthetic GATK jsons of growing size, to catch anything that scales
+# worse than linearly with the argument count before it shows up in a release regen.
+# Use: python3 bench_gatk_json.py --out bench_results.json [--compare last_results.json]
+
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+
+import parse_gatk_json
+
+STAGES = ('load', 'help', 'classify', 'tree', 'serialize', 'post_process', 'write')
+BENCH_TOOL = 'BenchTool'
+# Needs pandoc (the <h3> is outside the built in converter), so the help stage measures a real conversion.
+DESCRIPTION = ('<p>Synthetic tool used to benchmark the wrapper generator.</p><h3>Usage</h3>'
+               '<ul><li>one</li><li><b>two</b></li></ul><pre>gatk BenchTool -I in.bam</pre>')
+COMMON = (('--help', 'boolean', 'common', 'false'), ('--verbosity', 'LogLevel', 'common', 'INFO'),
+          ('--tmp-dir', 'File', 'common', 'null'), ('--read-filter', 'List[String]', 'common', '[]'),
+          ('--intervals', 'List[String]', 'common', '[]'), ('--reference', 'String', 'required', 'null'))
+
+
+def supply_args():
+    parser = argparse.ArgumentParser(description='Benchmark the GATK4 wrapper generator')
+    parser.add_argument('--sizes', default='10,100,1000,10000', help='Comma separated argument counts')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size, the fastest of each stage is kept')
+    parser.add_argument('--out', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Results JSON from an earlier run to compare against')
+    return parser.parse_args()
+
+
+def argument(name, type, kind, default, options=(), min_value='NA', max_value='NA'):
+    """
+    One argument blob, shaped like the ones in the GATK jsons.
+    :return:
+    """
+    return {'summary': 'Synthetic %s argument, with "quotes" & <angle brackets>' % name, 'name': name,
+            'synonyms': 'NA', 'type': type, 'required': 'yes' if kind == 'required' else 'no', 'fulltext': '',
+            'defaultValue': default, 'minValue': min_value, 'maxValue': max_value, 'minRecValue': 'NA',
+            'maxRecValue': 'NA', 'kind': kind, 'options': [{'summary': '', 'name': option} for option in options]}
+
+
+def synthetic_json(n_args):
+    """
+    A tool json with n_args arguments mixing selects, VCF inputs, outputs, booleans, numbers and text.
+    The VCF inputs and outputs are registered in gen_in_fmt/gen_out_fmt, which only lasts for this process.
+    :return:
+    """
+    arguments = [argument(*common) for common in COMMON]
+    kinds = ('optional', 'advanced', 'common', 'required')
+    for i in range(n_args - len(arguments)):
+        kind = kinds[i % len(kinds)]
+        flavour = i % 6
+        if flavour == 0:
+            arguments.append(argument('--bench-select-%d' % i, 'IntervalMergingRule', kind, 'ALL',
+                                      options=('ALL', 'OVERLAPPING_ONLY')))
+        elif flavour == 1:
+            parse_gatk_json.Mappings.gen_in_fmt['bench_vcf_%d' % i] = 'vcf,vcf_bgzip'
+            arguments.append(argument('--bench-vcf-%d' % i, 'FeatureInput[VariantContext]', kind, 'null'))
+        elif flavour == 2:
+            parse_gatk_json.Mappings.gen_out_fmt['bench_out_%d' % i] = 'txt'
+            arguments.append(argument('--bench-out-%d' % i, 'String', 'advanced', 'null'))
+        elif flavour == 3:
+            arguments.append(argument('--bench-flag-%d' % i, 'boolean', kind, 'true' if i % 2 else 'false'))
+        elif flavour == 4:
+            arguments.append(argument('--bench-double-%d' % i, 'double', kind, '1.0E-6',
+                                      min_value='0.0', max_value='Infinity'))
+        else:
+            arguments.append(argument('--bench-text-%d' % i, 'String', kind, 'null'))
+    return {'summary': 'Synthetic benchmark tool ', 'name': BENCH_TOOL, 'description': DESCRIPTION,
+            'arguments': arguments}
+
+
+def bench_size(n_args, repeat, work_dir):
+    """
+    Build the wrapper for an n_args tool repeat times.
+    :return: fastest seconds per stage, of the ToolClassifier pass on its own, plus the wrapper size
+    """
+    json_path = os.path.join(work_dir, 'bench_%d.json' % n_args)
+    tool_json = synthetic_json(n_args)
+    with open(json_path, 'w') as handle:
+        json.dump(tool_json, handle, indent=2)
+    args = argparse.Namespace(json=json_path, xml_out=work_dir, old_galaxy=False, pandoc_cache=None,
+                              no_pandoc_cache=True, no_fast_help=False, post_process=True)
+    best = {}
+    classifier = None
+    for _ in range(repeat):
+        # Every argument of a synthetic tool is new, keep it that way for the repeats.
+        parse_gatk_json.argument_cache.clear()
+        myshell = parse_gatk_json.XmlEtrees(args)
+        myshell.write_me()
+        for stage, seconds in myshell.timings.items():
+            best[stage] = min(seconds, best.get(stage, seconds))
+        # The table pass the classify stage starts with, without the JsonXml construction around it.
+        start = time.perf_counter()
+        parse_gatk_json.ToolClassifier(BENCH_TOOL, args).classify(tool_json['arguments'])
+        seconds = time.perf_counter() - start
+        classifier = seconds if classifier is None else min(seconds, classifier)
+    best['total'] = sum(best.values())
+    return {'arguments': n_args, 'stages': best, 'classifier': classifier,
+            'xml_bytes': os.path.getsize(myshell.create_output_loc())}
+
+
+def print_results(results, previous=None):
+    """
+    Table of milliseconds per stage, with the ratio to an earlier run when there is one.
+    :return:
+    """
+    before = {}
+    if previous:
+        before = {result['arguments']: result['stages'] for result in previous['results']}
+    columns = STAGES + ('total',)
+    print('%8s ' % 'args' + ' '.join('%12s' % stage for stage in columns) + ' %10s %12s' % ('us/arg', 'table us/arg'))
+    for result in results:
+        cells = []
+        for stage in columns:
+            ms = result['stages'].get(stage, 0.0) * 1000
+            old = before.get(result['arguments'], {}).get(stage)
+            cells.append('%12s' % ('%.1f' % ms if not old else '%.1f x%.2f' % (ms, ms / (old * 1000))))
+        per_arg = result['stages']['total'] / result['arguments'] * 1e6
+        # Results saved before the classifier was timed on its own don't have it.
+        table = result.get('classifier', 0.0) / result['arguments'] * 1e6
+        print('%8d ' % result['arguments'] + ' '.join(cells) + ' %10.1f %12.2f' % (per_arg, table))
+
+
+def main():
+    args = supply_args()
+    parse_gatk_json.Mappings.tool_data[BENCH_TOOL] = dict(parse_gatk_json.Mappings.tool_data['HaplotypeCaller'])
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Warm up first so the lazy lxml/pypandoc imports don't land in the smallest size's numbers.
+        bench_size(10, 1, work_dir)
+        results = [bench_size(int(size), args.repeat, work_dir) for size in args.sizes.split(',')]
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r') as handle:
+            previous = json.load(handle)
+    print_results(results, previous)
+    if args.out:
+        with open(args.out, 'w') as handle:
+            json.dump({'generator': parse_gatk_json.VERSION, 'python': platform.python_version(),
+                       'results': results}, handle, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+# Time post_parser.py's cleanup on a synthetic wrapper with a large cheetah section, and check the compiled
+# macro argument match against the plain per argument substring scan it replaced.
+# Use: python3 bench_post_parser.py [--lines 20000] [--repeat 5]
+
+import argparse
+import time
+
+import post_parser
+
+TOOL_LINE = '<tool id="gatk4_auto_benchtool" name="GATK4 BenchTool" version="@WRAPPER_VERSION@0" profile="17.09">\n'
+
+
+def supply_args():
+    parser = argparse.ArgumentParser(description='Benchmark the post_parser.py wrapper cleanup')
+    parser.add_argument('--lines', type=int, default=20000, help='Lines of the synthetic wrapper')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement, the fastest is kept')
+    return parser.parse_args()
+
+
+def synthetic_wrapper(n_lines):
+    """
+    A wrapper with up to n_lines lines, nearly all of them in the command section. One block in four uses a macro
+    argument and one in four is a boolean, the rest are plain tool arguments.
+    :return: list of lines, line endings included
+    """
+    head = [TOOL_LINE, '  <command detect_errors="exit_code"><![CDATA[\n']
+    tail = ['#include source=$log_opts#]]></command>\n', '  <inputs>\n',
+            '    <param name="flag" argument="--flag" type="boolean" truevalue="--flag" falsevalue="" optional="true"'
+            ' checked="true" label="Flag" help="A flag"/>\n',
+            '  </inputs>\n', '</tool>\n']
+    body = []
+    i = 0
+    # Whole three line blocks only, the cleanup refuses an #if that is never closed.
+    while len(head) + len(body) + len(tail) + 3 <= n_lines:
+        kind = i % 4
+        if kind == 0:
+            argument = post_parser.MACRO_ARGUMENTS[i % len(post_parser.MACRO_ARGUMENTS)]
+            body += ['#if $common.%s\n' % argument, '--%s $common.%s\n' % (argument, argument), '#end if\n']
+        elif kind == 1:
+            body += ['#if $optional.bench_flag_%d\n' % i, '$optional.bench_flag_%d\n' % i, '#end if\n']
+        else:
+            body += ['#if $optional.bench_text_%d\n' % i, '--bench-text-%d $optional.bench_text_%d\n' % (i, i),
+                     '#end if\n']
+        i += 1
+    return head + body + tail
+
+
+def scan_match(line):
+    """
+    The check post_parser.py used to make on every line, one substring scan per macro argument.
+    :return:
+    """
+    return any("." + argument in line for argument in post_parser.MACRO_ARGUMENTS)
+
+
+def fastest(repeat, function, *args):
+    """
+    :return: fastest of repeat runs in seconds, and the last result
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def main():
+    args = supply_args()
+    lines = synthetic_wrapper(args.lines)
+    scan_seconds, scanned = fastest(args.repeat, lambda: [scan_match(line) for line in lines])
+    regex_seconds, matched = fastest(args.repeat, lambda: [bool(post_parser.macro_argument_re.search(line))
+                                                           for line in lines])
+    if scanned != matched:
+        raise SystemExit('The compiled match disagrees with the substring scan on %d lines' %
+                         sum(a != b for a, b in zip(scanned, matched)))
+    clean_seconds, cleaned = fastest(args.repeat, post_parser.clean_wrapper, ''.join(lines))
+    print('%d lines, %d matched a macro argument, %d kept' % (len(lines), sum(matched), cleaned.count('\n')))
+    print('substring scan %8.1f ms' % (scan_seconds * 1000))
+    print('compiled match %8.1f ms  x%.1f' % (regex_seconds * 1000, scan_seconds / regex_seconds))
+    print('clean_wrapper  %8.1f ms' % (clean_seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare wrappers against reference ones built while attribute values were still escaped twice, allowing only that
+difference: each attribute must equal the reference value with one level of entities removed"""
+
+import glob
+import os
+import sys
+from xml.sax.saxutils import unescape
+
+from lxml import etree
+
+# The entities the generator used to add on top of what lxml writes.
+ENTITIES = {'&quot;': '"', '&apos;': "'"}
+
+
+def compare(reference, wrapper):
+    """
+    Walk both trees together.
+    :return: list of differences, as (element path, what differs)
+    """
+    differences = []
+    tree = reference.getroottree()
+    for expected, found in zip(reference.iter(), wrapper.iter()):
+        where = tree.getpath(expected)
+        if expected.tag != found.tag:
+            differences.append((where, 'tag %s, found %s' % (expected.tag, found.tag)))
+            break
+        if expected.text != found.text or expected.tail != found.tail:
+            differences.append((where, 'text'))
+        if list(expected.attrib) != list(found.attrib):
+            differences.append((where, 'attributes %s, found %s' % (list(expected.attrib), list(found.attrib))))
+            continue
+        for name, value in expected.attrib.items():
+            if unescape(value, ENTITIES) != found.get(name):
+                differences.append((where, '@%s %r, found %r' % (name, unescape(value, ENTITIES), found.get(name))))
+    if len(list(reference.iter())) != len(list(wrapper.iter())):
+        differences.append(('/', 'element count'))
+    return differences
+
+
+def main(reference_dir, wrapper_dir):
+    parser = etree.XMLParser(strip_cdata=False)
+    checked = 0
+    mismatched = 0
+    for reference_path in sorted(glob.glob(os.path.join(reference_dir, '*.xml'))):
+        wrapper_path = os.path.join(wrapper_dir, os.path.basename(reference_path))
+        if not os.path.exists(wrapper_path):
+            print('MISSING ' + wrapper_path)
+            mismatched += 1
+            continue
+        checked += 1
+        differences = compare(etree.parse(reference_path, parser).getroot(),
+                              etree.parse(wrapper_path, parser).getroot())
+        if differences:
+            mismatched += 1
+            print('MISMATCH ' + wrapper_path)
+            for where, what in differences:
+                print('  %s: %s' % (where, what))
+    print('%d compared, %d mismatched' % (checked, mismatched))
+    return mismatched
+
+
+if __name__ == "__main__":
+    args = sys.argv
+    sys.exit(1 if main(args[1], args[2]) else 0)
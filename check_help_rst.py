@@ -0,0 +1,39 @@
+"""Compare the built in html -> rst help conversion against pandoc for a folder of GATK jsons"""
+
+import difflib
+import glob
+import json
+import os
+import sys
+
+import pypandoc
+
+from parse_gatk_json import fast_help_rst
+
+
+def main(json_dir):
+    checked = 0
+    pandoc_only = 0
+    mismatched = 0
+    for json_path in sorted(glob.glob(os.path.join(json_dir, '*.json'))):
+        with open(json_path, 'r') as myfile:
+            html = json.load(myfile)['description']
+        fast = fast_help_rst(html)
+        if fast is None:
+            # Not supported by the built in converter, so pandoc is used for it anyway.
+            pandoc_only += 1
+            continue
+        checked += 1
+        expected = pypandoc.convert_text(html, 'rst', format='html')
+        if fast != expected:
+            mismatched += 1
+            print('MISMATCH ' + json_path)
+            sys.stdout.writelines(difflib.unified_diff(expected.splitlines(True), fast.splitlines(True),
+                                                       'pandoc', 'built in'))
+    print('%d compared, %d mismatched, %d left to pandoc' % (checked, mismatched, pandoc_only))
+    return mismatched
+
+
+if __name__ == "__main__":
+    args = sys.argv
+    sys.exit(1 if main(args[1]) else 0)
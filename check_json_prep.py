@@ -0,0 +1,67 @@
+"""Compare the tool_data entries json_prep.py builds for a folder of GATK jsons against the line by line reader it
+used before, and time both"""
+
+import glob
+import os
+import sys
+import time
+
+import json_prep
+
+
+def line_read_json(file_name):
+    """
+    The reader json_prep.py had before it parsed the json, only right for GATK's one key per line layout.
+    :return: tool name, argument names
+    """
+    arguments = []
+    tool = file_name
+    with open(file_name, 'r') as json_file:
+        for line in json_file:
+            if "name" in line and "," in line:
+                if "--" not in line:
+                    tool = line.split('"')[3]
+                else:
+                    arguments.append(line.split('"')[3])
+    return tool, arguments
+
+
+def entry_with(reader, file_name):
+    """
+    Run json_prep.tool_entry with reader in place of json_prep.read_json.
+    :return: tool name, entry, seconds taken
+    """
+    read_json = json_prep.read_json
+    json_prep.read_json = reader
+    try:
+        start = time.perf_counter()
+        tool, entry = json_prep.tool_entry(file_name)
+        return tool, entry, time.perf_counter() - start
+    finally:
+        json_prep.read_json = read_json
+
+
+def main(json_dir):
+    checked = 0
+    mismatched = 0
+    line_seconds = 0.0
+    json_seconds = 0.0
+    for json_path in sorted(glob.glob(os.path.join(json_dir, '*.json'))):
+        checked += 1
+        expected_tool, expected, seconds = entry_with(line_read_json, json_path)
+        line_seconds += seconds
+        tool, entry, seconds = entry_with(json_prep.read_json, json_path)
+        json_seconds += seconds
+        if (tool, entry) != (expected_tool, expected):
+            mismatched += 1
+            print('MISMATCH ' + json_path)
+            print('  line reader: %s %s' % (expected_tool, expected))
+            print('  json_prep:   %s %s' % (tool, entry))
+    print('%d compared, %d mismatched' % (checked, mismatched))
+    print('line reader %8.1f ms, json_prep %8.1f ms' % (line_seconds * 1000, json_seconds * 1000))
+    return mismatched
+
+
+if __name__ == "__main__":
+    args = sys.argv
+    sys.exit(1 if main(args[1]) else 0)
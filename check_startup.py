@@ -0,0 +1,50 @@
+"""Check that the fast startup paths of parse_gatk_json.py don't import the heavy modules, and report their import time"""
+
+import os
+import subprocess
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parse_gatk_json.py')
+# Only needed once a wrapper is actually being built.
+HEAVY_MODULES = ('lxml', 'pypandoc', 'concurrent.futures')
+# Runs that should never get past argument handling.
+FAST_PATHS = (['--version'], [], ['--json'])
+
+
+def import_times(script_args):
+    """
+    Run the script under -X importtime.
+    :return: dict of module name -> (cumulative import time in microseconds, whether it's a top level import)
+    """
+    run = subprocess.run([sys.executable, '-X', 'importtime', SCRIPT] + script_args,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    times = {}
+    for line in run.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                # Nested imports are indented past the single space that follows the |.
+                times[name.strip()] = (int(cumulative), not name.startswith('  '))
+    return times
+
+
+def main(max_ms=None):
+    failed = False
+    for script_args in FAST_PATHS:
+        times = import_times(script_args)
+        heavy = sorted(name for name in times if any(name == module or name.startswith(module + '.') for module in HEAVY_MODULES))
+        # The cumulative times of the top level imports add up to the whole.
+        total_ms = sum(cumulative for cumulative, top_level in times.values() if top_level) / 1000.0
+        print('%-12s %7.1f ms of imports' % (' '.join(script_args) or '(no args)', total_ms))
+        if heavy:
+            failed = True
+            print('  FAIL imported ' + ', '.join(heavy))
+        if max_ms is not None and total_ms > max_ms:
+            failed = True
+            print('  FAIL over the %.1f ms limit' % max_ms)
+    return failed
+
+
+if __name__ == "__main__":
+    args = sys.argv
+    sys.exit(1 if main(float(args[1]) if len(args) > 1 else None) else 0)
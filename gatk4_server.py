@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+
+# Keep the wrapper generator loaded in one long running process, so tools asking for one wrapper at a time don't
+# each pay for interpreter startup, the lxml/pypandoc imports and loading the mappings.
+# Use: python3 gatk4_server.py serve [--port 8711]
+#      python3 gatk4_server.py wrap gatk4_json/json_name.json [--xml_out output]
+# wrap asks the server when one is listening on --port and builds the wrapper itself otherwise.
+# The server only listens on localhost. POST /wrapper takes {"json_path": path} or {"json": GATK json}, along with
+# optional "old_galaxy" and "post_process" booleans, and answers with the wrapper XML.
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import parse_gatk_json
+
+DEFAULT_PORT = 8711
+
+
+def supply_args():
+    parser = argparse.ArgumentParser(description='Serve GATK4 wrappers from a warm generator, or ask for one')
+    parser.add_argument('--version', action='version', version='%(prog)s ' + parse_gatk_json.VERSION)
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    serve = commands.add_parser('serve', help='Run the generator server')
+    wrap = commands.add_parser('wrap', help='Build one wrapper, through the server when it is running')
+    wrap.add_argument('json', help='Input JSON')
+    wrap.add_argument('--xml_out', help='Output Directory, the wrapper is printed when not given')
+    wrap.add_argument('--old_galaxy', action='store_true', help="Produce XML for Galaxy versions that don't support section tag")
+    wrap.add_argument('--post_process', action='store_true', help='Apply the post_parser.py cleanup')
+    wrap.add_argument('--send_json', action='store_true', help='Send the json itself rather than its path, for a server that does not share this filesystem view')
+    for command in (serve, wrap):
+        command.add_argument('--port', type=int, default=DEFAULT_PORT, help='Localhost port of the server')
+        command.add_argument('--pandoc_cache', default=parse_gatk_json.default_pandoc_cache(), help='Directory caching the pandoc help conversion')
+        command.add_argument('--no_pandoc_cache', action='store_true', help='Always run pandoc, ignoring --pandoc_cache')
+        command.add_argument('--no_fast_help', action='store_true', help='Send every description through pandoc')
+    return parser.parse_args()
+
+
+def generator_args(args, request):
+    """
+    The options a wrapper is built with: the server's (or client's) own, plus the ones the request may set.
+    :return:
+    """
+    return argparse.Namespace(json=None, xml_out='.', old_galaxy=bool(request.get('old_galaxy', False)),
+                              post_process=bool(request.get('post_process', False)),
+                              pandoc_cache=args.pandoc_cache, no_pandoc_cache=args.no_pandoc_cache,
+                              no_fast_help=args.no_fast_help)
+
+
+def build_wrapper(args, request):
+    """
+    Run the XmlEtrees pipeline for one request, in this process.
+    :return: wrapper file name, wrapper XML
+    """
+    tool_args = generator_args(args, request)
+    if 'json' in request:
+        import tempfile
+        with tempfile.TemporaryDirectory() as work_dir:
+            tool_args.json = os.path.join(work_dir, 'request.json')
+            with open(tool_args.json, 'w') as handle:
+                json.dump(request['json'], handle)
+            myshell = parse_gatk_json.XmlEtrees(tool_args)
+    else:
+        tool_args.json = request['json_path']
+        myshell = parse_gatk_json.XmlEtrees(tool_args)
+    return os.path.basename(myshell.create_output_loc()), myshell.render()
+
+
+class WrapperHandler(BaseHTTPRequestHandler):
+    """
+    Answers POST /wrapper. Requests are handled one at a time, the generator keeps its state at class level.
+    """
+    server_version = 'gatk4_wrapper/' + parse_gatk_json.VERSION
+
+    def do_POST(self):
+        if self.path != '/wrapper':
+            self.reply(404, 'text/plain', 'POST to /wrapper')
+            return
+        start = time.perf_counter()
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8'))
+            if not isinstance(request, dict) or not ('json' in request or 'json_path' in request):
+                raise ValueError('expected {"json_path": ...} or {"json": ...}')
+        except ValueError as e:
+            self.reply(400, 'text/plain', 'Bad request: %s' % e)
+            return
+        self.server.reload_if_changed()
+        try:
+            name, xml = build_wrapper(self.server.args, request)
+        except Exception as e:
+            self.reply(500, 'text/plain', '%s: %s' % (type(e).__name__, e))
+            print('FAIL %s: %s: %s' % (request.get('json_path', 'posted json'), type(e).__name__, e))
+            return
+        self.reply(200, 'application/xml; charset=utf-8', xml, {'X-Wrapper-Name': name})
+        print('OK   %s -> %s %.0f ms' % (request.get('json_path', 'posted json'), name,
+                                         (time.perf_counter() - start) * 1000))
+
+    def reply(self, status, content_type, text, headers=None):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Each request is already reported with its outcome and time.
+        pass
+
+
+class WrapperServer(HTTPServer):
+    """
+    Holds the options wrappers are built with, and notices when tool_data.jsonl is edited under it.
+    """
+    def __init__(self, args):
+        HTTPServer.__init__(self, ('127.0.0.1', args.port), WrapperHandler)
+        self.args = args
+        self.data_stamp = self.stamp()
+
+    def stamp(self):
+        try:
+            stat = os.stat(parse_gatk_json.Mappings.tool_data.data_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_if_changed(self):
+        stamp = self.stamp()
+        if stamp != self.data_stamp:
+            parse_gatk_json.Mappings.tool_data.reload()
+            self.data_stamp = stamp
+
+
+def serve(args):
+    server = WrapperServer(args)
+    print('Serving GATK4 wrappers on http://127.0.0.1:%d/wrapper, Ctrl-C to stop' % args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print('Stopped serving')
+    finally:
+        server.server_close()
+
+
+def ask_server(args, request):
+    """
+    Send a request to the server.
+    :return: wrapper file name, wrapper XML, or None when there is no server to ask
+    """
+    connection = http.client.HTTPConnection('127.0.0.1', args.port, timeout=300)
+    try:
+        connection.request('POST', '/wrapper', json.dumps(request), {'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        body = response.read().decode('utf-8')
+    except ConnectionRefusedError:
+        return None
+    finally:
+        connection.close()
+    if response.status != 200:
+        raise RuntimeError('server: %s' % body)
+    return response.getheader('X-Wrapper-Name'), body
+
+
+def wrap(args):
+    """
+    Build one wrapper, preferring the server, and write or print it.
+    :return:
+    """
+    request = {'old_galaxy': args.old_galaxy, 'post_process': args.post_process}
+    if args.send_json:
+        with open(args.json, 'r') as handle:
+            request['json'] = json.load(handle)
+    else:
+        request['json_path'] = os.path.abspath(args.json)
+    answer = ask_server(args, request)
+    if answer is None:
+        print('No server on port %d, building in this process' % args.port, file=sys.stderr)
+        answer = build_wrapper(args, request)
+    name, xml = answer
+    if args.xml_out:
+        with open(os.path.join(args.xml_out, name), 'w') as handle:
+            handle.write(xml)
+    else:
+        sys.stdout.write(xml)
+
+
+def main():
+    args = supply_args()
+    if args.command == 'serve':
+        serve(args)
+    else:
+        try:
+            wrap(args)
+        except Exception as e:
+            sys.exit('FAIL %s: %s: %s' % (args.json, type(e).__name__, e))
+
+
+if __name__ == "__main__":
+    main()
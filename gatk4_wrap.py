@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+# Run the whole wrapper pipeline in one process: macro detection (json_prep.py), wrapper generation
+# (parse_gatk_json.py) and cleanup (post_parser.py).
+# Use: python3 gatk4_wrap.py --xml_out output gatk4_json/json_name.json [more jsons or folders of jsons]
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import json_prep
+import parse_gatk_json
+
+
+def supply_args():
+    parser = argparse.ArgumentParser(description='Build cleaned up GATK4 wrappers from GATK json files')
+    parser.add_argument('json', nargs='+', help='Input JSONs, or folders of them')
+    parser.add_argument('--xml_out', required=True, help='Output Directory')
+    parser.add_argument('--pandoc_cache', default=parse_gatk_json.default_pandoc_cache(), help='Directory caching the pandoc help conversion')
+    parser.add_argument('--no_pandoc_cache', action='store_true', help='Always run pandoc, ignoring --pandoc_cache')
+    parser.add_argument('--no_fast_help', action='store_true', help='Send every description through pandoc')
+    parser.add_argument('--old_galaxy', action="store_true", help="Produce XML for Galaxy versions that don't support section tag")
+    parser.add_argument('--version', action='version', version='%(prog)s ' + parse_gatk_json.VERSION)
+    args = parser.parse_args()
+    # The cleanup is always wanted here, the generator applies it to each section as it is written.
+    args.post_process = True
+    return args
+
+
+def expand_jsons(paths):
+    """
+    Folders on the command line stand for every json in them.
+    :return:
+    """
+    json_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            json_paths.extend(sorted(glob.glob(os.path.join(path, '*.json'))))
+        else:
+            json_paths.append(path)
+    return json_paths
+
+
+def prep(json_path):
+    """
+    Macro detection. Tools that already have a curated tool_data entry keep it, the rest get the entry
+    json_prep.py would have printed.
+    :return: tool name, and whether the entry was generated
+    """
+    tool, entry = json_prep.tool_entry(json_path)
+    if tool in parse_gatk_json.Mappings.tool_data:
+        return tool, False
+    parse_gatk_json.Mappings.tool_data[tool] = entry
+    return tool, True
+
+
+def wrap(args, json_path, timings):
+    """
+    Build, clean up and write the wrapper for one json, adding the time spent to each stage in timings.
+    :return: path of the written wrapper
+    """
+    start = time.perf_counter()
+    tool, generated = prep(json_path)
+    if generated:
+        print('NOTE %s has no tool_data entry, using the detected macros. Check its inputs and outputs.' % tool)
+    timings['prep'] += time.perf_counter() - start
+
+    tool_args = argparse.Namespace(**vars(args))
+    tool_args.json = json_path
+    myshell = parse_gatk_json.XmlEtrees(tool_args)
+
+    # Generation, cleanup and writing are interleaved section by section, so split them by the wrapper's own timings.
+    # The help stage is where pandoc runs for descriptions the batch didn't prerender.
+    myshell.write_me()
+    timings['help'] += myshell.timings['help']
+    timings['generate'] += sum(myshell.timings[stage] for stage in ('load', 'classify', 'tree', 'serialize'))
+    timings['cleanup'] += myshell.timings['post_process']
+    timings['write'] += myshell.timings['write']
+    return myshell.create_output_loc()
+
+
+def main():
+    args = supply_args()
+    json_paths = expand_jsons(args.json)
+    timings = {'help': 0.0, 'prep': 0.0, 'generate': 0.0, 'cleanup': 0.0, 'write': 0.0}
+
+    start = time.perf_counter()
+    parse_gatk_json.set_prerendered_help(parse_gatk_json.prerender_help(args, json_paths))
+    timings['help'] += time.perf_counter() - start
+
+    failed = 0
+    for json_path in json_paths:
+        try:
+            print('OK   %s -> %s' % (json_path, wrap(args, json_path, timings)))
+        except Exception as e:
+            failed += 1
+            print('FAIL %s: %s: %s' % (json_path, type(e).__name__, e))
+    print('%d converted, %d failed' % (len(json_paths) - failed, failed))
+    print('stage timings: ' + ', '.join('%s %.3fs' % (stage, seconds) for stage, seconds in timings.items()))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
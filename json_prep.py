@@ -1,84 +1,80 @@
 """Create the needed tool_data entry for the parse_gatk_json.py script"""
 
+import json
 import sys
 
-def main(file_name):
-  json_file = open(file_name, 'r')
-  #make a list for all the arguments
-  arguments = []
-  #initiate a tool name
-  tool = file_name
-  #iterate over the file line by line
-  for line in json_file:
-    #look for all lines that contain names of tools or arguments
-    if "name" in line:
-      #make sure we don't get the names of select options
-      if "," in line:
-        #look for the tool name which is the last one and the one without the --
-        if "--" not in line:
-          #split the line based on " and take the fourth piece 
-          tool = line.split('"')[3]
-        else:
-          #if it is an argument then split the line as befor and add the argument name to the argument list
-          argument = line.split('"')[3]
-          arguments.append(argument)
+from tool_data import ToolData, tool_key
 
+#a dictionary with all the macro names that go along with the arguments. macros must end in _cmd _inputs _pre or _outputs
+macro_dict = {"--help": ["all_cmd", "all_inputs", "log_outputs"], "--gatk-config-file": ["gatk_common_cmd", "gatk_common_inputs"], "--exclude-intervals": ["intervals_pre", "intervals_cmd", "intervals_inputs"], "--GA4GH_CLIENT_SECRETS": ["picard_cmd", "picard_inputs", "picard_outputs"], "--reference": ["ref_cmd", "ref_inputs"], "--REFERENCE_SEQUENCE": ["picard_ref_cmd", "ref_inputs"], "--read-filter": ["read_filter_cmd", "read_filter_inputs"], "--create-output-variant-md5": ["seq_dict_cmd", "seq_dict_inputs", "seq_dict_outputs"]}
 
-  json_file.close()
+def read_json(file_name):
+  """Find the tool name and the argument names in a GATK json"""
+  with open(file_name, 'r') as json_file:
+    gatk_json = json.load(json_file)
+  #the tool name is the top level name, the arguments keep the order they have in the json
+  arguments = [argument['name'] for argument in gatk_json['arguments']]
+  return gatk_json['name'], arguments
 
-  #a dictionary with all the macro names that go along with the arguments. macros must end in _cmd _inputs _pre or _outputs
-  macro_dict = {"--help": ["all_cmd", "all_inputs", "log_outputs"], "--gatk-config-file": ["gatk_common_cmd", "gatk_common_inputs"], "--exclude-intervals": ["intervals_pre", "intervals_cmd", "intervals_inputs"], "--GA4GH_CLIENT_SECRETS": ["picard_cmd", "picard_inputs", "picard_outputs"], "--reference": ["ref_cmd", "ref_inputs"], "--REFERENCE_SEQUENCE": ["picard_ref_cmd", "ref_inputs"], "--read-filter": ["read_filter_cmd", "read_filter_inputs"], "--create-output-variant-md5": ["seq_dict_cmd", "seq_dict_inputs", "seq_dict_outputs"]}
+def tool_entry(file_name):
+  """Build the tool_data entry for a GATK json, returning the tool name and the entry"""
+  tool, arguments = read_json(file_name)
 
-  #initiate the strings with teh macros
-  pre_commands = ""
-
-  commands = ""
-
-  inputs_params = ""
-
-  output_params = ""
+  #find the arguments that have macros, in the order they appear in the json
+  with_macros = [arg for arg in arguments if arg in macro_dict]
 
   #initate the list of macros
   macros = []
+  for arg in with_macros:
+    macros.extend(macro_dict[arg])
 
-  #check each argument for corresponding macros
-  for arg in arguments:
-    if arg in macro_dict:
-      macros = macros + macro_dict[arg]
+  #initiate the entry with empty formats and macro lists
+  entry = {'output_fmt': {}, 'input_fmt': {}, 'pre_tmpls': [], 'post_tmpls': [], 'pre_params': [], 'opt_params': [], 'adv_params': [], 'post_params': [], 'output_params': []}
 
-  #checked each macro for its ending and add to the corresponding string
+  #checked each macro for its ending and add to the corresponding list
   for macro in macros:
     if "_cmd" in macro:
-      if commands == "":
-        commands += "'" + macro + "'"
-      else:
-        commands += ", '" + macro + "'"
+      entry['post_tmpls'].append(macro)
     elif "_pre" in macro:
-      if pre_commands == "":
-        pre_commands += "'" + macro + "'"
-      else:
-        pre_commands += ", '" + macro + "'"
+      entry['pre_tmpls'].append(macro)
     elif "_inputs" in macro:
-      if inputs_params == "":
-        inputs_params += "'" + macro + "'"
-      else:
-        inputs_params += ", '" + macro + "'"
+      entry['pre_params'].append(macro)
     elif "_outputs" in macro:
-      if output_params == "":
-        output_params += "'" + macro + "'"
-      else:
-        output_params += ", '" + macro + "'"
-
-        
-  #check if the tool name has an extra (Picard) and if so remove it
-  if "(Picard)" in tool:
-    tool = tool.split(" ")[0]
-  
+      entry['output_params'].append(macro)
+
+  #the log options always come last
+  entry['post_tmpls'].append('log_opts')
+
+  #file the entry under the name the generator looks it up by, without extras like (Picard) or **BETA**
+  return tool_key(tool), entry
+
+def quoted(macros):
+  """Join the macro names as quoted python strings"""
+  return ", ".join("'" + macro + "'" for macro in macros)
+
+def save_entry(tool, entry):
+  """Add the entry to tool_data.jsonl, or refresh the macros of an existing entry and keep its hand curated parts"""
+  tool_data = ToolData()
+  if tool in tool_data:
+    current = tool_data[tool]
+    for key in ('output_fmt', 'input_fmt', 'opt_params', 'adv_params', 'post_params'):
+      entry[key] = current[key]
+  tool_data.save(tool, entry)
+
+def main(file_name, save=False):
+  tool, entry = tool_entry(file_name)
+
+  #with --save write the entry straight into tool_data.jsonl instead of printing it
+  if save:
+    save_entry(tool, entry)
+    print("saved " + tool + " to " + ToolData().data_file)
+    return
+
   #print the tool config and insert the needed tool name and macro strings
-  print("'" + tool + "':\n\t{'output_fmt': {},\n\t'input_fmt':{},\n\t'pre_tmpls': [" + pre_commands + "],\n\t'post_tmpls': [" + commands + "'log_opts'],\n\t'pre_params':[" + inputs_params + "],\n\t'opt_params':[],\n\t'adv_params':[],\n\t'post_params': [],\n\t'output_params':[" + output_params + "]},")
+  print("'" + tool + "':\n\t{'output_fmt': {},\n\t'input_fmt':{},\n\t'pre_tmpls': [" + quoted(entry['pre_tmpls']) + "],\n\t'post_tmpls': [" + quoted(entry['post_tmpls']) + "],\n\t'pre_params':[" + quoted(entry['pre_params']) + "],\n\t'opt_params':[],\n\t'adv_params':[],\n\t'post_params': [],\n\t'output_params':[" + quoted(entry['output_params']) + "]},")
 
 
 
 if __name__ == "__main__":
     args = sys.argv
-    main(args[1])
\ No newline at end of file
+    main(args[1], "--save" in args[2:])
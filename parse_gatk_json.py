@@ -5,2281 +5,299 @@
 # Macros for read filter options?  These have their own json files it seems...
 # gVCF not currently set to be different than VCF.
 # Use: python3 parse_gatk_json.py --json gatk4_json/org_broadinstitute_hellbender_tools_walkers_CombineGVCFs.json --xml_out output
+# Batch use: python3 parse_gatk_json.py --json_dir gatk4_json --xml_out output
 
-from lxml import etree
+from collections import namedtuple
+from html.parser import HTMLParser
 from string import Template
-from xml.sax.saxutils import escape
 import argparse
+import copy
+import glob
+import hashlib
+import importlib
+import io
 import json
-import pypandoc
+import os
+import post_parser
+import re
+import sys
+import time
+import uuid
 
-VERSION="0.2.0"
+from tool_data import ToolData, tool_key
+
+VERSION="0.3.0"
+
+
+class LazyModule(object):
+    """
+    Stand in for a module that is only imported when one of its attributes is first used, so --version,
+    bad arguments and fully cached runs don't pay for importing lxml or pypandoc.
+    """
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        value = getattr(importlib.import_module(self._name), attr)
+        # Later lookups find it on the instance and skip __getattr__.
+        setattr(self, attr, value)
+        return value
+
+
+etree = LazyModule('lxml.etree')
+pypandoc = LazyModule('pypandoc')
+
+
+def default_pandoc_cache():
+    """
+    Location of the pandoc cache when --pandoc_cache isn't given.
+    :return:
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'gatk4_wrapper', 'pandoc')
 
 def supply_args():
     parser = argparse.ArgumentParser(description='')
     parser.add_argument('--json', help='Input JSON')
+    parser.add_argument('--json_dir', help='Directory of input JSONs, converted in a single run')
+    parser.add_argument('--json_glob', default='*.json', help='Pattern used to pick JSONs out of --json_dir')
     parser.add_argument('--xml_out', help='Output Directory')
+    parser.add_argument('--incremental', action='store_true', help='With --json_dir, only rebuild wrappers whose json or mappings changed')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes for --json_dir, 0 uses every CPU')
+    parser.add_argument('--pandoc_cache', default=default_pandoc_cache(), help='Directory caching the pandoc help conversion')
+    parser.add_argument('--no_pandoc_cache', action='store_true', help='Always run pandoc, ignoring --pandoc_cache')
+    parser.add_argument('--no_fast_help', action='store_true', help='Send every description through pandoc, even ones the built in converter handles')
+    parser.add_argument('--post_process', action='store_true', help='Apply the post_parser.py cleanup to each section as it is written, instead of as a separate step')
+    parser.add_argument('--profile', action='store_true', help='Print the time spent in each stage, slowest tools first')
+    parser.add_argument('--profile_dir', help='Also save cProfile stats for each tool into this directory')
+    parser.add_argument('--watch', action='store_true', help='With --json_dir, keep running and rebuild wrappers whenever their json or tool_data.jsonl changes')
+    parser.add_argument('--watch_interval', type=float, default=0.5, help='Seconds between checks for changes with --watch')
+    parser.add_argument('--metrics_out', help='Write per tool and overall run metrics to this JSON file')
     parser.add_argument('--old_galaxy', action="store_true", help="Produce XML for Galaxy versions that don't support section tag")
     parser.add_argument('--version', action='version', version='%(prog)s ' + VERSION)
     args = parser.parse_args()
+    if not args.json and not args.json_dir:
+        parser.error('one of --json or --json_dir is required')
+    if args.watch and not args.json_dir:
+        parser.error('--watch needs --json_dir')
     return args
 
 
+class PercentTemplate(Template):
+    delimiter = '%'
+
+
 class Mappings(object):
     """
     Hold all of the mappings we need to provide for parameters.
+    These live on the class so they are built once per process and shared by every JsonXml, treat them as read only.
     """
-    def __init__(self):
-        # These are parameters that are already covered in the macros.xml file.  They also may be options that we
-        # don't want included in any GATK wrapper.
-        # REFERENCE_SEQUENCE: If reference is denoted optional then it should go in the optional section.  Build function to place it.
-        # Should be able to utilize self.blob['required'] to determine section (either optional or main), then look at self.macro_to_chth to determine
-        # the macro that REFERENCE_SEQUENCE is associated to.
-        self.xml_json_type_map = {
-                             'Boolean': 'boolean',
-                             'boolean': 'boolean',
-                             'Long': 'integer',
-                             'long': 'integer',
-                             'Integer': 'integer',
-                             'int': 'integer',
-                             'byte': 'integer',
-                             'Double': 'float',
-                             'double': 'float',
-                             'Float': 'float',
-                             'float': 'float',
-                             'Format': 'select',
-                             'String': 'text',
-                             'Set[String]': 'text',
-                             'File': 'data',
-                             'Set[File]': 'data',
-                             'Set[MetricAccumulationLevel]': 'text',
-                             'List[File]': 'data',
-                             'List[Double]': 'text',
-                             'List[Integer]': 'integer',
-                             'List[String]': 'text',
-                             'List[Type]': 'text',
-                             'List[FeatureInput[VariantContext]]': 'data',
-                             'ArrayList[String]': 'text',
-                             'FeatureInput[VariantContext]': 'data',
-                             'LogLevel': 'select',
-                             'Implementation': 'select',
-                             'IntervalMergingRule': 'select',
-                             'IntervalSetRule': 'select',
-                             'ReferenceConfidenceMode': 'select',
-                             'ValidationStringency': 'select',
-                             'GenotypingOutputMode': 'select',
-                             'SortOrder': 'select',
-                             'ScoringStrategy': 'select',
-                             'OutputMode': 'select',
-                             'PCRErrorModel': 'select',
-                             'WriterType': 'select',
-                             'NumberAlleleRestriction': 'select',
-                             'DuplicateTaggingPolicy': 'select',
-                             'List[FeatureInput[Feature]]': 'data',
-                             'Mode': 'select',
-                             'List[PairOrientation]': 'text',
-                             'PrimaryAlignmentStrategy': 'select',
-                             'UnmappingReadStrategy': 'select',
-                             'Set[PairOrientation]': 'text'
-                             }
-        self.xml_json_num_map = {'Infinity': '', '-Infinity': '', 'NA': ''}
-        self.xml_json_req_map = {'no': 'true', 'yes': 'false'}
-        # If the parameter is in here, it won't be included in either the cheetah section or the param section.
-        self.common_args = ("version", "showHidden", "help", "arguments_file", "VERBOSITY", "verbosity", "gatk_config_file", "gcs_max_retries", "use_jdk_deflater", "use_jdk_inflater", "interval_merging_rule", "interval_set_rule", "disable_read_filter", "disable_tool_default_read_filters", "read_filter", "create_output_variant_index", "add_output_sam_program_record", "add_output_vcf_command_line", "create_output_bam_index", "create_output_bam_md5", "create_output_variant_md5",
-                            "VALIDATION_STRINGENCY", "USE_JDK_INFLATER", "USE_JDK_DEFLATER", "TMP_DIR", "QUIET",
-                            "MAX_RECORDS_IN_RAM", "GA4GH_CLIENT_SECRETS", "CREATE_MD5_FILE", "CREATE_INDEX",
-                            "COMPRESSION_LEVEL", "REFERENCE_SEQUENCE", "OUTPUT", "SEQUENCE_DICTIONARY", "INPUT",
-                            "input", "reference", "output", "annotation", "annotation_group", "annotations_to_exclude",
-                            "intervals", "exclude_intervals", "read_index", "interval_padding",
-                            "interval_exclusion_padding", "output_prefix", "sequence_dictionary", "variant")
-        self.read_filter_args = ('')
-        # There seems to be a significant amount of information that can't be retrieved from the provided json.
-        # Make this in to a config file.
-        # Might be able to classify a bunch of this based on input output files for a particular tool.  For instance, vcf_tabix
-        # is applicable if the input is a VCF.
-        # Optional status of a partiular parameters could be connected to macros as well.  For instance, ref_sel is the macro for the reference genome.
-        # So, the 'ref_sel': 'reference' relation could be used along with 'required' status to place these.
-        # One challenge with this is the macros would have to either be prebuilt with the necessary section variable, or
-        # would have to be rewritten on the fly.
-        self.tool_data = {'AnnotatePairOrientation':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'BwaMemIndexImageCreator':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'ClipReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'ConvertHeaderlessHadoopBamShardToBam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CountBases':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CountReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'FixCallSetSampleOrdering':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'FixMisencodedBaseQualityReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'FlagStat':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'GatherVcfsCloud':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'GetSampleName':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'HaplotypeCallerSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'IndexFeatureFile':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'LeftAlignIndels':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'PrintReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'SplitReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'AnnotateIntervals':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CallCopyRatioSegments':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CollectAllelicCounts':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CollectReadCounts':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CreateReadCountPanelOfNormals':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'DenoiseReadCounts':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'DetermineGermlineContigPloidy':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'GermlineCNVCaller':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'ModelSegments':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PostprocessGermlineCNVCalls':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'PreprocessIntervals':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'PlotDenoisedCopyRatios':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PlotModeledSegments':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'FilterByOrientationBias':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'Funcotator':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'GenomicsDBImport':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'ApplyBQSRSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'BaseRecalibratorSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'BaseRecalibratorSparkSharded':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CreateHadoopBamSplittingIndex':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'ParallelCopyGCSDirectoryIntoHDFSSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PileupSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'BwaSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PathSeqBuildKmers':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PathSeqBuildReferenceTaxonomy':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PathSeqBwaSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PathSeqFilterSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PathSeqPipelineSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PathSeqScoreSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'BQSRPipelineSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'BwaAndMarkDuplicatesPipelineSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CountBasesSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CountReadsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CountVariantsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'FlagStatSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PrintReadsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'PrintVariantsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'ReadsPipelineSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'SortSamSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CollectBaseDistributionByCycleSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CollectInsertSizeMetricsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CollectMultipleMetricsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CollectQualityYieldMetricsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'MeanQualityByCycleSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'QualityScoreDistributionSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'StructuralVariationDiscoveryPipelineSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'DiscoverVariantsFromContigAlignmentsSAMSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'SvDiscoverFromLocalAssemblyContigAlignmentsSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CpxVariantReInterpreterSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CalcMetadataSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'ExtractSVEvidenceSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'FindBadGenomicKmersSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'FindBreakpointEvidenceSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'ExtractOriginalAlignmentRecordsByNameSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'MarkDuplicatesSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CompareDuplicatesSpark':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CompareBaseQualities':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CombineGVCFs':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CountVariants':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'GenotypeGVCFs':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'RevertBaseQualityScores':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'SplitIntervals':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'UnmarkDuplicates':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'AnalyzeCovariates':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'ApplyBQSR':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'BaseRecalibrator':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'GatherBQSRReports':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CalculateContamination':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'GetPileupSummaries':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'VariantFiltration':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'HaplotypeCaller':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'EstimateLibraryComplexityGATK':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'MarkDuplicatesGATK':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CreateSomaticPanelOfNormals':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'FilterMutectCalls':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'Mutect2':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CheckPileup':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'Pileup':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'FilterAlignmentArtifacts':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'ASEReadCounter':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'SplitNCigarReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'AnnotateVcfWithBamDepth':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'AnnotateVcfWithExpectedAlleleFraction':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CalculateMixingFractions':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'Concordance':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CountFalsePositives':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'RemoveNearbyIndels':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'ValidateBasicSomaticShortMutations':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CalculateGenotypePosteriors':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'SelectVariants':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'UpdateVCFSequenceDictionary':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'ValidateVariants':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'VariantsToTable':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'ApplyVQSR':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CNNScoreVariants':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CNNVariantTrain':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'CNNVariantWriteTensors':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'FilterVariantTranches':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'GatherTranches':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['gatk_common_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['gatk_common_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['log_outputs']},
-                        'VariantRecalibrator':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': ['intervals_pre'],
-                            'post_tmpls': ['seq_dict_cmd', 'intervals_cmd', 'gatk_common_cmd', 'all_cmd', 'read_filter_cmd', 'ref_cmd', 'log_opts'],
-                            'pre_params':['seq_dict_inputs', 'intervals_inputs', 'gatk_common_inputs', 'all_inputs', 'read_filter_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['seq_dict_outputs', 'log_outputs']},
-                        'CollectAlignmentSummaryMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectBaseDistributionByCycle':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectGcBiasMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectInsertSizeMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectJumpingLibraryMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectMultipleMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectOxoGMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectQualityYieldMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectRawWgsMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectRnaSeqMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectRrbsMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectWgsMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectWgsMetricsWithNonZeroCoverage':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CompareMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MeanQualityByCycle':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'QualityScoreDistribution':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectSequencingArtifactMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ConvertSequencingArtifactToOxoG':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectHsMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectTargetedPcrMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectIndependentReplicateMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'BamToBfq':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CheckFingerprint':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ClusterCrosscheckMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CrosscheckFingerprints':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CrosscheckReadGroupFingerprints':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CheckIlluminaDirectory':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectIlluminaBasecallingMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectIlluminaLaneMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ExtractIlluminaBarcodes':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'IlluminaBasecallsToFastq':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'IlluminaBasecallsToSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MarkIlluminaAdapters':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectHiSeqXPfFailMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ExtractSequences':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'NonNFastaSize':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'NormalizeFasta':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'AddCommentsToBam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'AddOrReplaceReadGroups':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'BamIndexStats':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'BuildBamIndex':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CalculateReadGroupChecksum':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CheckTerminatorBlock':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CleanSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CompareSAMs':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CreateSequenceDictionary':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'DownsampleSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'FastqToSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'FilterSamReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'FixMateInformation':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'GatherBamFiles':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MergeBamAlignment':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MergeSamFiles':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'PositionBasedDownsampleSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ReorderSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ReplaceSamHeader':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'RevertOriginalBaseQualitiesAndAddMateCigar':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'RevertSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SamFormatConverter':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SamToFastq':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SetNmAndUqTags':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SetNmMdAndUqTags':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SortSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SplitSamByLibrary':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SplitSamByNumberOfReads':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ValidateSamFile':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ViewSam':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'EstimateLibraryComplexity':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MarkDuplicates':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MarkDuplicatesWithMateCigar':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SimpleMarkDuplicatesWithMateCigar':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'UmiAwareMarkDuplicatesWithMateCigar':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'BaitDesigner':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'BedToIntervalList':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'FifoBuffer':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'IntervalListToBed':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'IntervalListTools':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'LiftOverIntervalList':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'ScatterIntervalsByNs':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'AccumulateVariantCallingMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'CollectVariantCallingMetrics':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'FixVcfHeader':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'GatherVcfs':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'GenotypeConcordance':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'LiftoverVcf':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MakeSitesOnlyVcf':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'FindMendelianViolations':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'MergeVcfs':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'RenameSampleInVcf':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SortVcf':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'SplitVcfs':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'UpdateVcfSequenceDictionary':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'VcfFormatConverter':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'VcfToIntervalList':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']},
-                        'FilterVcf':
-                            {'output_fmt': {},
-                            'input_fmt':{},
-                            'pre_tmpls': [],
-                            'post_tmpls': ['picard_cmd', 'all_cmd', 'picard_ref_cmd', 'log_opts'],
-                            'pre_params':['picard_inputs', 'all_inputs', 'ref_inputs'],
-                            'opt_params':[],
-                            'adv_params':[],
-                            'post_params': [],
-                            'output_params':['picard_outputs', 'log_outputs']}
-                          }
-
-
-        self.gen_out_fmt = {'activity_profile_out': 'tabular',
-                            'assembly_region_out': 'tabular',
-                            'graph_output': 'txt',
-                            'bam_output': 'bam'
-                            }
-        self.gen_in_fmt = {'alleles': 'vcf,vcf_bgzip',
-                           'pedigree': 'tabular',
-                           'population_callset': 'vcf,vcf_bgzip',
-                           'contamination_fraction_per_sample_file': 'tabular',
-                           'concordance': 'vcf,vcf_bgzip',
-                           'comp': 'vcf,vcf_bgzip',
-                           'discordance': 'vcf,vcf_bgzip',
-                           'gatk_config_file': 'txt',
-                           'annotated_intervals': 'gatk_interval',
-                           'count_panel_of_normals': 'h5',
-                           'allelic_counts': 'tabular',
-                           'normal_allelic_counts': 'tabular',
-                           'denoised_copy_ratios': 'tabular',
-                           'dbsnp': 'vcf,vcf_bgzip',
-                           'BAIT_INTERVALS': 'picard_interval_list',
-                           'TARGET_INTERVALS': 'picard_interval_list',
-                           'segments': 'tabular'
-                           }
-
-        self.param_tmpls = {'integer': ['name', 'argument', 'type', 'optional', 'value', 'min', 'max', 'label', 'help'],
-                            'float': ['name', 'argument', 'type', 'optional', 'value', 'min', 'max', 'label', 'help'],
-                            'text': ['name', 'argument', 'type', 'optional', 'value', 'label', 'help'],
-                            'data': ['name', 'argument', 'type', 'optional', 'format', 'label', 'help'],
-                            'select': ['name', 'argument', 'type', 'optional', 'label', 'help'],
-                            'boolean': ['name', 'argument', 'type', 'truevalue', 'falsevalue', 'optional', 'checked', 'label', 'help'],
-                            'output': ['format', 'name', 'label', 'help']}
+    # These are parameters that are already covered in the macros.xml file.  They also may be options that we
+    # don't want included in any GATK wrapper.
+    # REFERENCE_SEQUENCE: If reference is denoted optional then it should go in the optional section.  Build function to place it.
+    # Should be able to utilize self.blob['required'] to determine section (either optional or main), then look at self.macro_to_chth to determine
+    # the macro that REFERENCE_SEQUENCE is associated to.
+    xml_json_type_map = {
+                    'Boolean': 'boolean',
+                    'boolean': 'boolean',
+                    'Long': 'integer',
+                    'long': 'integer',
+                    'Integer': 'integer',
+                    'int': 'integer',
+                    'byte': 'integer',
+                    'Double': 'float',
+                    'double': 'float',
+                    'Float': 'float',
+                    'float': 'float',
+                    'Format': 'select',
+                    'String': 'text',
+                    'Set[String]': 'text',
+                    'File': 'data',
+                    'Set[File]': 'data',
+                    'Set[MetricAccumulationLevel]': 'text',
+                    'List[File]': 'data',
+                    'List[Double]': 'text',
+                    'List[Integer]': 'integer',
+                    'List[String]': 'text',
+                    'List[Type]': 'text',
+                    'List[FeatureInput[VariantContext]]': 'data',
+                    'ArrayList[String]': 'text',
+                    'FeatureInput[VariantContext]': 'data',
+                    'LogLevel': 'select',
+                    'Implementation': 'select',
+                    'IntervalMergingRule': 'select',
+                    'IntervalSetRule': 'select',
+                    'ReferenceConfidenceMode': 'select',
+                    'ValidationStringency': 'select',
+                    'GenotypingOutputMode': 'select',
+                    'SortOrder': 'select',
+                    'ScoringStrategy': 'select',
+                    'OutputMode': 'select',
+                    'PCRErrorModel': 'select',
+                    'WriterType': 'select',
+                    'NumberAlleleRestriction': 'select',
+                    'DuplicateTaggingPolicy': 'select',
+                    'List[FeatureInput[Feature]]': 'data',
+                    'Mode': 'select',
+                    'List[PairOrientation]': 'text',
+                    'PrimaryAlignmentStrategy': 'select',
+                    'UnmappingReadStrategy': 'select',
+                    'Set[PairOrientation]': 'text'
+                    }
+    xml_json_num_map = {'Infinity': '', '-Infinity': '', 'NA': ''}
+    xml_json_req_map = {'no': 'true', 'yes': 'false'}
+    # If the parameter is in here, it won't be included in either the cheetah section or the param section.
+    # Left to the macros, post_parser.py strips the same arguments from the command section.
+    common_args = post_parser.MACRO_ARGUMENTS
+    read_filter_args = ('')
+    # There seems to be a significant amount of information that can't be retrieved from the provided json.
+    # Make this in to a config file.
+    # Might be able to classify a bunch of this based on input output files for a particular tool.  For instance, vcf_tabix
+    # is applicable if the input is a VCF.
+    # Optional status of a partiular parameters could be connected to macros as well.  For instance, ref_sel is the macro for the reference genome.
+    # So, the 'ref_sel': 'reference' relation could be used along with 'required' status to place these.
+    # One challenge with this is the macros would have to either be prebuilt with the necessary section variable, or
+    # would have to be rewritten on the fly.
+    # Loaded from tool_data.jsonl, only the tools actually used get parsed. json_prep.py --save adds or updates entries.
+    tool_data = ToolData()
+
+
+    gen_out_fmt = {'activity_profile_out': 'tabular',
+                   'assembly_region_out': 'tabular',
+                   'graph_output': 'txt',
+                   'bam_output': 'bam'
+                   }
+    gen_in_fmt = {'alleles': 'vcf,vcf_bgzip',
+                  'pedigree': 'tabular',
+                  'population_callset': 'vcf,vcf_bgzip',
+                  'contamination_fraction_per_sample_file': 'tabular',
+                  'concordance': 'vcf,vcf_bgzip',
+                  'comp': 'vcf,vcf_bgzip',
+                  'discordance': 'vcf,vcf_bgzip',
+                  'gatk_config_file': 'txt',
+                  'annotated_intervals': 'gatk_interval',
+                  'count_panel_of_normals': 'h5',
+                  'allelic_counts': 'tabular',
+                  'normal_allelic_counts': 'tabular',
+                  'denoised_copy_ratios': 'tabular',
+                  'dbsnp': 'vcf,vcf_bgzip',
+                  'BAIT_INTERVALS': 'picard_interval_list',
+                  'TARGET_INTERVALS': 'picard_interval_list',
+                  'segments': 'tabular'
+                  }
+
+    param_tmpls = {'integer': ['name', 'argument', 'type', 'optional', 'value', 'min', 'max', 'label', 'help'],
+                   'float': ['name', 'argument', 'type', 'optional', 'value', 'min', 'max', 'label', 'help'],
+                   'text': ['name', 'argument', 'type', 'optional', 'value', 'label', 'help'],
+                   'data': ['name', 'argument', 'type', 'optional', 'format', 'label', 'help'],
+                   'select': ['name', 'argument', 'type', 'optional', 'label', 'help'],
+                   'boolean': ['name', 'argument', 'type', 'truevalue', 'falsevalue', 'optional', 'checked', 'label', 'help'],
+                   'output': ['format', 'name', 'label', 'help']}
 
 
 class XmlTemplates(object):
-    def __init__(self):
-        # Cheetah section
-        self.chth_tmpl = PercentTemplate('#include source=$%macro#')
-        self.req_out_chth = PercentTemplate('%argument $%name')
-        self.vcf_choose = PercentTemplate('#if $%section.%name'
-                                          '\n#if $%section.%name.is_of_type("vcf_bgzip")'
-                                          '\n%argument %name.vcf.gz'
-                                          '\n#else'
-                                          '\n%argument %name.vcf'
-                                          '\n#end if'
-                                          '\n#end if')
-        self.vcf_tabix = PercentTemplate(
-                                         '#if $%section.%name'
-                                         '\n#set datatype = $%section.%name.datatype'
-                                         '\n#if $%section.%name.is_of_type("vcf_bgzip")'
-                                         '\nln -s $%section.%name %name.vcf.gz &&'
-                                         '\ntabix %name.vcf.gz &&'
-                                         '\n#else'
-                                         '\nln -s $%section.%name %name.vcf &&'
-                                         '\n#end if'
-                                         '\n#end if')
-        self.file_chth = PercentTemplate('#if $%section.%out_sel_name\n%argument $%name\n#end if')
-#        self.file_chth_old_gal = PercentTemplate('#if str($output_opt.output_opt_sel) == "yes":\n#if $output_opt.%out_sel_name:\n%argument $%name\n#end if\n#end if')
-        self.ext_arg = '#if $%section.%name\n%argument $%section.%name\n#end if'
-#        self.ext_arg_old_gal = '#if str($%section.%{section}_sel) == "yes":\n#if $%section.%name:\n%argument $%section.%name\n#end if\n#end if'
-        self.reg_arg = '#if $%name\n%argument $%name\n#end if'
-
-        # XML section. Most of this is handled via etrees, but some cases are more easily handled here.
-        self.xml_tmpl = Template('<expand macro="$macro_name" />')
-        self.sel_out = Template('<option value="$value" selected="$selected">$value</option>')
-        self.out_label_tmpl = Template('$${tool.name} on $${on_string}: $name $format')
-        self.out_tmpl = Template('<data format="$format" name="$name" label="$${tool.name} on $${on_string}: $format" />')
+    """
+    Compiled templates, shared at class level like Mappings.
+    """
+    # Cheetah section
+    chth_tmpl = PercentTemplate('#include source=$%macro#')
+    req_out_chth = PercentTemplate('%argument $%name')
+    vcf_choose = PercentTemplate('#if $%section.%name'
+                                 '\n#if $%section.%name.is_of_type("vcf_bgzip")'
+                                 '\n%argument %name.vcf.gz'
+                                 '\n#else'
+                                 '\n%argument %name.vcf'
+                                 '\n#end if'
+                                 '\n#end if')
+    vcf_tabix = PercentTemplate(
+                                '#if $%section.%name'
+                                '\n#set datatype = $%section.%name.datatype'
+                                '\n#if $%section.%name.is_of_type("vcf_bgzip")'
+                                '\nln -s $%section.%name %name.vcf.gz &&'
+                                '\ntabix %name.vcf.gz &&'
+                                '\n#else'
+                                '\nln -s $%section.%name %name.vcf &&'
+                                '\n#end if'
+                                '\n#end if')
+    file_chth = PercentTemplate('#if $%section.%out_sel_name\n%argument $%name\n#end if')
+#    file_chth_old_gal = PercentTemplate('#if str($output_opt.output_opt_sel) == "yes":\n#if $output_opt.%out_sel_name:\n%argument $%name\n#end if\n#end if')
+    ext_arg = '#if $%section.%name\n%argument $%section.%name\n#end if'
+#    ext_arg_old_gal = '#if str($%section.%{section}_sel) == "yes":\n#if $%section.%name:\n%argument $%section.%name\n#end if\n#end if'
+    reg_arg = '#if $%name\n%argument $%name\n#end if'
+    # Compiled forms of the argument templates above, booleans drop the %argument since the truevalue carries it.
+    ext_arg_tmpl = PercentTemplate(ext_arg)
+    ext_arg_bool_tmpl = PercentTemplate(ext_arg.replace('%argument ', ''))
+    reg_arg_tmpl = PercentTemplate(reg_arg)
+    reg_arg_bool_tmpl = PercentTemplate(reg_arg.replace('%argument ', ''))
+
+    # XML section. Most of this is handled via etrees, but some cases are more easily handled here.
+    xml_tmpl = Template('<expand macro="$macro_name" />')
+    sel_out = Template('<option value="$value" selected="$selected">$value</option>')
+    out_label_tmpl = Template('$${tool.name} on $${on_string}: $name $format')
+    out_tmpl = Template('<data format="$format" name="$name" label="$${tool.name} on $${on_string}: $format" />')
+
+
+# How one argument of a tool is treated, everything JsonXml needs to know beyond the argument's own blob.
+# is_input_vcf is None for arguments without a gen_in_fmt entry, format is '' for anything but inputs and outputs.
+ArgumentClass = namedtuple('ArgumentClass', ('pname', 'section', 'is_output', 'is_req_output', 'is_input',
+                                             'is_input_vcf', 'common', 'format'))
+
+
+class ToolClassifier(object):
+    """
+    The mappings one tool's arguments are classified against, gathered once for the tool into sets and a single
+    format table, so each argument takes a few set lookups.
+    """
+    def __init__(self, tool_name, args):
+        tool = Mappings.tool_data[tool_name]
+        self.old_galaxy = args.old_galaxy
+        self.outputs = frozenset(Mappings.gen_out_fmt)
+        self.req_outputs = frozenset(tool['output_fmt'])
+        self.inputs = frozenset(tool['input_fmt']).union(Mappings.gen_in_fmt)
+        self.gen_inputs = frozenset(Mappings.gen_in_fmt)
+        self.vcf_inputs = frozenset(pname for pname, fmt in Mappings.gen_in_fmt.items() if fmt == 'vcf,vcf_bgzip')
+        self.common = frozenset(Mappings.common_args).difference(tool['output_fmt'], tool['input_fmt'])
+        # The tool's own formats win over the generic ones.
+        self.output_formats = dict(Mappings.gen_out_fmt)
+        self.output_formats.update(tool['output_fmt'])
+        self.input_formats = dict(Mappings.gen_in_fmt)
+        self.input_formats.update(tool['input_fmt'])
+
+    def classify(self, blobs):
+        """
+        Classify all of a tool's argument blobs in one pass.
+        :return: list of ArgumentClass, in the order of blobs
+        """
+        outputs = self.outputs
+        req_outputs = self.req_outputs
+        inputs = self.inputs
+        gen_inputs = self.gen_inputs
+        vcf_inputs = self.vcf_inputs
+        common = self.common
+        output_formats = self.output_formats
+        input_formats = self.input_formats
+        old_galaxy = self.old_galaxy
+        classes = []
+        for blob in blobs:
+            pname = blob['name'].lstrip('-').replace('-', '_')
+            is_output = pname in outputs
+            is_req_output = pname in req_outputs
+            is_input = pname in inputs
+            if old_galaxy:
+                section = ''
+            elif is_output:
+                section = 'output_opt'
+            else:
+                section = blob['kind']
+            if is_output or is_req_output:
+                fmt = output_formats[pname]
+            elif is_input:
+                fmt = input_formats[pname]
+            else:
+                fmt = ''
+            classes.append(ArgumentClass(pname, section, is_output, is_req_output, is_input,
+                                         pname in vcf_inputs if pname in gen_inputs else None, pname in common, fmt))
+        return classes
 
 
 class JsonXml(Mappings, XmlTemplates):
@@ -2300,13 +318,12 @@ class JsonXml(Mappings, XmlTemplates):
       "kind": "optional",
       "options": []
     """
-    def __init__(self, blob, tool_name, args):
+    def __init__(self, blob, tool_name, args, classified=None):
         """
         :param blob:
+        :param classified: ArgumentClass for the blob from the tool's ToolClassifier, worked out here if not given
         """
-        # Access mappings and templates for each parameter.
-        Mappings.__init__(self)
-        XmlTemplates.__init__(self)
+        # Mappings and templates are class attributes, so nothing to build here.
         # This comes from the json file provided from GATK4.
         self.args = args
         self.blob = blob
@@ -2317,35 +334,28 @@ class JsonXml(Mappings, XmlTemplates):
             self.type = self.xml_json_type_map[blob['type']]
         except:
             raise Exception('Argument type %s not recognized.' % self.blob['type'])
+        if classified is None:
+            classified = ToolClassifier(tool_name, args).classify([blob])[0]
+        self.classified = classified
         # Make parameter name available more readily.
-        self.pname = self.blob['name'].lstrip('-').replace('-', '_')
+        self.pname = classified.pname
         # The 'kind' category determines section, and required status of parameter.
         # Potential values are ('advanced', 'common', 'deprecated', 'optional', 'positional', 'required')
-        self.section = blob['kind']
-        # Remove the section variable when we don't want to use the Galaxy section tag.
-        if self.pname in self.gen_out_fmt:
-            self.section = 'output_opt'
-        if self.args.old_galaxy:
-            self.section = ''
+        # Outputs go to the output_opt section, and no section is used when we don't want the Galaxy section tag.
+        self.section = classified.section
         # Since output status is not listed in the json blob, we provide it as a mapping.
         # TODO: Potentially search for phrase "Output" or "output" from description and set status accordingly.
-        self.is_output = self.pname in self.gen_out_fmt
-
-        self.is_req_output = self.pname in self.tool_data[self.tool_name]['output_fmt']
-        self.is_input = (self.pname in self.tool_data[self.tool_name]['input_fmt']) or (self.pname in self.gen_in_fmt)
-        if self.pname in self.gen_in_fmt:
-            self.is_input_vcf = self.is_input and self.gen_in_fmt[self.pname] == 'vcf,vcf_bgzip'
-        else:
-            self.is_input_vcf = None
+        self.is_output = classified.is_output
+        self.is_req_output = classified.is_req_output
+        self.is_input = classified.is_input
+        self.is_input_vcf = classified.is_input_vcf
 
         if self.is_output:
             self.out_sel_name = self.pname + '_sel'
             self.out_sel_arg = self.blob['name'] + '_sel'
         self.xml_out = self.reblob()
         # Set to common if this argument is seen inside the known common arguments.
-        self.common = self.pname in self.common_args and \
-                      self.pname not in self.tool_data[self.tool_name]['output_fmt'] and \
-                      self.pname not in self.tool_data[self.tool_name]['input_fmt']
+        self.common = classified.common
         #self.has_mcro_xml = self.xml_out['name'] in self.macro_xml
         #self.has_mcro_tmpl = self.xml_out['name'] in self.macro_tmpl
         # Check to see if the type, as defined in the json file, is recognized.
@@ -2381,9 +391,9 @@ class JsonXml(Mappings, XmlTemplates):
 #        self.xml_param = {label:self.xml_out[label] for label in self.param_tmpls[self.xml_out['type']]}
 
         if self.is_output:
-            self.xml_param = {label:self.xml_out[label] for label in self.param_tmpls['output']}
+            self.xml_param = self._param_attrib(self.param_tmpls['output'])
         elif not self.common:
-            self.xml_param = {label:self.xml_out[label] for label in self.param_tmpls[self.xml_out['type']]}
+            self.xml_param = self._param_attrib(self.param_tmpls[self.xml_out['type']])
         else:
             self.xml_param = None
 
@@ -2402,26 +412,23 @@ class JsonXml(Mappings, XmlTemplates):
             cht_tmpl = self.file_chth
             return cht_tmpl.substitute(self.xml_out)
         elif self.is_input and not pre:
-            if self.pname in self.gen_in_fmt:
-                if self.gen_in_fmt[self.pname] == 'vcf,vcf_bgzip':
-                    cht_tmpl = self.vcf_choose
-                else:
-                    cht_tmpl = PercentTemplate(self.reg_arg)
-            elif self.pname in self.tool_data[self.tool_name]['input_fmt']:
+            # is_input_vcf is None when the input only has a tool specific format.
+            if self.is_input_vcf:
+                cht_tmpl = self.vcf_choose
+            elif self.is_input_vcf is False:
+                cht_tmpl = self.reg_arg_tmpl
+            else:
                 cht_tmpl = self.req_out_chth
             return cht_tmpl.substitute(self.xml_out)
         elif self.is_input and pre:
             cht_tmpl = self.vcf_tabix
             return cht_tmpl.substitute(self.xml_out)
         else:
+            is_bool = self.xml_out['type'] == 'boolean'
             if self.xml_out['section'] not in ['required']:
-                template_string = self.ext_arg
-            else:
-                template_string = self.reg_arg
-            if self.xml_out['type'] == 'boolean':
-                cht_tmpl = PercentTemplate(template_string.replace('%argument ', ''))
+                cht_tmpl = self.ext_arg_bool_tmpl if is_bool else self.ext_arg_tmpl
             else:
-                cht_tmpl = PercentTemplate(template_string)
+                cht_tmpl = self.reg_arg_bool_tmpl if is_bool else self.reg_arg_tmpl
             return cht_tmpl.substitute(self.xml_out)
 
     def sel_prep(self):
@@ -2494,10 +501,18 @@ class JsonXml(Mappings, XmlTemplates):
         #     xml_out['format'] = self.in_frmt
         # if self.param_format_map(self.blob['name']):
         #     xml_out['format'] = self.param_format_map(self.blob['name'])
-        for key in ['argument', 'checked', 'falsevalue', 'format', 'help', 'label', 'max', 'min', 'name', 'optional', 'truevalue', 'type', 'value']:
-            xml_out[key] = escape(xml_out[key], {'"': '&quot;', "'": '&apos;'})
+        # Values are left unescaped, lxml escapes the attributes once when the wrapper is written.
         return xml_out
 
+    def _param_attrib(self, labels):
+        """
+        The attributes of the param or data element, in template order, ready to hand to lxml. An empty min or
+        max is left out.
+        :return:
+        """
+        return {label: self.xml_out[label] for label in labels
+                if self.xml_out[label] or label not in ('min', 'max')}
+
     def _assign_label(self, format):
         """
         When we're working with an output, would like to add different infromation to the label field.
@@ -2532,23 +547,497 @@ class JsonXml(Mappings, XmlTemplates):
 
     def assign_format(self):
         """
-        Assign the format where necessary, like if we are dealing with an output param.
+        Assign the format where necessary, like if we are dealing with an output param. Looked up by the tool's
+        ToolClassifier.
+        :return:
+        """
+        return self.classified.format
+
+    def record(self):
+        """
+        The slim ArgumentRecord JsonShell keeps for this argument.
         :return:
         """
-        if self.is_output or self.is_req_output:
-            if self.pname in self.tool_data[self.tool_name]['output_fmt']:
-                return self.tool_data[self.tool_name]['output_fmt'][self.pname]
-            elif self.pname in self.gen_out_fmt:
-                return self.gen_out_fmt[self.pname]
-        elif self.is_input:
-            if self.pname in self.tool_data[self.tool_name]['input_fmt']:
-                print(self.tool_data[self.tool_name])
-                return self.tool_data[self.tool_name]['input_fmt'][self.pname]
-            elif self.pname in self.gen_in_fmt:
-                return self.gen_in_fmt[self.pname]
+        return ArgumentRecord(self.pname, self.section, self.is_input, self.is_output, self.is_req_output,
+                              self.is_select, self.chth, self.chth_pre, self.xml_param, self.sel_blob)
+
+
+class ArgumentRecord(object):
+    """
+    What the XML and Cheetah stages need from one argument, without the blob, xml_out and the rest of the JsonXml
+    that worked it out. A batch keeps one of these per distinct argument in the ArgumentCache.
+    """
+    __slots__ = ('pname', 'section', 'is_input', 'is_output', 'is_req_output', 'is_select', 'chth', 'chth_pre',
+                 'xml_param', 'sel_blob')
+
+    def __init__(self, pname, section, is_input, is_output, is_req_output, is_select, chth, chth_pre, xml_param,
+                 sel_blob):
+        self.pname = pname
+        self.section = section
+        self.is_input = is_input
+        self.is_output = is_output
+        self.is_req_output = is_req_output
+        self.is_select = is_select
+        self.chth = chth
+        self.chth_pre = chth_pre
+        self.xml_param = xml_param
+        self.sel_blob = sel_blob
+
+
+class ArgumentCache(object):
+    """
+    ArgumentRecords for the argument blobs already classified in this process. Arguments such as --help or
+    --verbosity come with the same blob in nearly every tool, so a batch only renders each of them once.
+    The key is the canonical blob plus the argument's ArgumentClass, which holds everything outside the blob
+    JsonXml looks at, and --old_galaxy.
+    Cached records are shared between tools, so nothing downstream may change them.
+    """
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, blob, tool_name, args, classified):
+        """
+        The ArgumentRecord for an argument, its JsonXml is only built when no equivalent one has been.
+        :return:
+        """
+        key = (json.dumps(blob, sort_keys=True), args.old_galaxy, classified)
+        record = self.entries.get(key)
+        if record is None:
+            self.misses += 1
+            record = self.entries[key] = JsonXml(blob, tool_name, args, classified).record()
         else:
-            # Not sure yet what this will be used for, but I think we need it.
-            return ''
+            self.hits += 1
+        return record
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+argument_cache = ArgumentCache()
+
+
+class UnsupportedHtml(Exception):
+    """
+    Raised by SimpleHtmlRst when the html has to go through pandoc.
+    """
+
+
+class SimpleHtmlRst(HTMLParser):
+    """
+    In process html -> rst conversion for the plain descriptions most GATK tools have: <p>, <a href>, <ul>/<li>,
+    <b>, <i> and <pre>. Output matches what pandoc gives for that subset, 72 column wrapping included.
+    Anything outside the subset, or text that pandoc would have to escape, raises UnsupportedHtml.
+    """
+    columns = 72
+    # Characters that rst may need escaped, left to pandoc.
+    special_chars = set('\\*`|<>\r')
+    # Characters that can follow closing markup without pandoc escaping the boundary.
+    after_markup = set(' .,;:!?)"\'-')
+    # Stands in for the unbreakable space between a link's text and its target while wrapping.
+    link_space = '\x00'
+
+    def __init__(self):
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.blocks = []
+        self.last_is_list = False
+        self.para = ''
+        self.items = None
+        self.in_li = False
+        self.pre = None
+        self.inline = None
+        self.inline_start = 0
+        self.href = None
+        self.check_after = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.pre is not None or self.inline:
+            raise UnsupportedHtml(tag)
+        if tag in ('b', 'i', 'a'):
+            if self.items is not None and not self.in_li:
+                raise UnsupportedHtml(tag)
+            if self.para[-1:] not in ('', ' ', '(', '"'):
+                raise UnsupportedHtml(tag)
+            if tag == 'a':
+                if len(attrs) != 1 or attrs[0][0] != 'href' or not attrs[0][1] or \
+                   re.search(r'[\s<>`\\]', attrs[0][1]) or attrs[0][1].startswith('mailto:'):
+                    raise UnsupportedHtml(tag)
+                self.href = attrs[0][1]
+            else:
+                if attrs:
+                    raise UnsupportedHtml(tag)
+                self.para += '**' if tag == 'b' else '*'
+            self.inline = tag
+            self.inline_start = len(self.para)
+        elif tag == 'li':
+            if attrs or self.items is None or self.in_li:
+                raise UnsupportedHtml(tag)
+            self.in_li = True
+        elif tag in ('p', 'ul', 'pre'):
+            if attrs or self.items is not None:
+                raise UnsupportedHtml(tag)
+            self._flush_para()
+            if tag == 'ul':
+                # pandoc separates back to back lists with a comment.
+                if self.last_is_list:
+                    raise UnsupportedHtml(tag)
+                self.items = []
+            elif tag == 'pre':
+                self.pre = ''
+        else:
+            raise UnsupportedHtml(tag)
+
+    def handle_endtag(self, tag):
+        if tag in ('b', 'i', 'a'):
+            if self.inline != tag:
+                raise UnsupportedHtml(tag)
+            text = self.para[self.inline_start:]
+            if not text or text[0] == ' ' or text[-1] == ' ':
+                raise UnsupportedHtml(tag)
+            if tag == 'a':
+                if text == self.href and re.match(r'https?://', self.href):
+                    # pandoc writes these as bare urls.
+                    pass
+                elif text == self.href:
+                    raise UnsupportedHtml(tag)
+                else:
+                    self.para = self.para[:self.inline_start] + '`' + text + self.link_space + '<' + self.href + '>`__'
+            else:
+                self.para += '**' if tag == 'b' else '*'
+            self.inline = None
+            self.check_after = True
+        elif self.inline:
+            raise UnsupportedHtml(tag)
+        elif tag == 'p':
+            if self.items is not None or self.pre is not None:
+                raise UnsupportedHtml(tag)
+            self._flush_para()
+        elif tag == 'li':
+            if not self.in_li or not self.para.strip(' '):
+                raise UnsupportedHtml(tag)
+            self.items.append(self.para.strip(' '))
+            self.para = ''
+            self.check_after = False
+            self.in_li = False
+        elif tag == 'ul':
+            if self.items is None or self.in_li or not self.items:
+                raise UnsupportedHtml(tag)
+            self.blocks.append('\n'.join(self._wrap_item(item) for item in self.items))
+            self.last_is_list = True
+            self.items = None
+        elif tag == 'pre':
+            if self.pre is None:
+                raise UnsupportedHtml(tag)
+            lines = self.pre.rstrip('\n').split('\n')
+            if not self.pre.strip() or not self.pre.isascii() or \
+               any('\t' in line or '\r' in line or line != line.rstrip() for line in lines):
+                raise UnsupportedHtml(tag)
+            self.blocks.append('::\n\n' + '\n'.join('   ' + line if line else '' for line in lines))
+            self.last_is_list = False
+            self.pre = None
+        else:
+            raise UnsupportedHtml(tag)
+
+    def handle_data(self, data):
+        if self.pre is not None:
+            self.pre += data
+            return
+        if self.items is not None and not self.in_li:
+            if data.strip():
+                raise UnsupportedHtml(data)
+            return
+        text = re.sub(r'\s+', ' ', data)
+        if not text.isascii() or self.special_chars.intersection(text) or \
+           re.search(r'(?<![A-Za-z0-9])_|_(?![A-Za-z0-9])', text):
+            raise UnsupportedHtml(data)
+        if self.check_after and text:
+            if text[0] not in self.after_markup:
+                raise UnsupportedHtml(data)
+            self.check_after = False
+        if text.startswith(' ') and self.para[-1:] in ('', ' '):
+            text = text[1:]
+        self.para += text
+
+    def handle_comment(self, data):
+        raise UnsupportedHtml(data)
+
+    def handle_decl(self, decl):
+        raise UnsupportedHtml(decl)
+
+    def handle_pi(self, data):
+        raise UnsupportedHtml(data)
+
+    def unknown_decl(self, data):
+        raise UnsupportedHtml(data)
+
+    def _flush_para(self):
+        """
+        Close off any inline text gathered so far as a paragraph.
+        :return:
+        """
+        self.check_after = False
+        text = self.para.strip(' ')
+        self.para = ''
+        if text:
+            self.blocks.append('\n'.join(self._wrap(text, self.columns)))
+            self.last_is_list = False
+
+    def _wrap(self, text, width):
+        """
+        Greedy line filling, the same way pandoc lays out paragraphs.
+        :return: list of lines
+        """
+        lines = []
+        line = ''
+        for word in text.split(' '):
+            if line and len(line) + 1 + len(word) > width:
+                lines.append(line)
+                line = word
+            elif line:
+                line += ' ' + word
+            else:
+                line = word
+        lines.append(line)
+        return [line.replace(self.link_space, ' ') for line in lines]
+
+    def _wrap_item(self, item):
+        """
+        A list item, wrapped and hung under its bullet.
+        :return:
+        """
+        return '- ' + '\n  '.join(self._wrap(item, self.columns - 2))
+
+    def finish(self):
+        """
+        Finish parsing and assemble the document.
+        :return: the rst
+        """
+        self.close()
+        if self.inline or self.items is not None or self.pre is not None:
+            raise UnsupportedHtml('unclosed tag')
+        self._flush_para()
+        return '\n\n'.join(self.blocks) + '\n'
+
+
+def fast_help_rst(html):
+    """
+    Convert html to rst without pandoc, when SimpleHtmlRst supports everything in it.
+    :return: the rst, or None if the html needs pandoc
+    """
+    parser = SimpleHtmlRst()
+    try:
+        parser.feed(html)
+        return parser.finish()
+    except UnsupportedHtml:
+        return None
+
+
+class PandocCache(object):
+    """
+    On disk cache of the html -> rst help conversion, so unchanged descriptions skip the pandoc subprocess.
+    Entries are keyed on a hash of the description and the pandoc version, one file per entry.
+    """
+    # Part of every key, bumped when entries already written are known to be wrong so they are never read again.
+    # 2: batch conversions used to label repeated headings (.. _usage-1:).
+    key_format = '2'
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, html):
+        """
+        File that holds the conversion for this html.
+        :return:
+        """
+        key = hashlib.sha256((self.key_format + '\0' + pypandoc.get_pandoc_version() + '\0' + html).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + '.rst')
+
+    def has(self, html):
+        """
+        Check for an entry without touching the hit/miss counters.
+        :return:
+        """
+        return os.path.exists(self._entry_path(html))
+
+    def lookup(self, html):
+        """
+        Fetch a previous conversion.
+        :return: the rst, or None on a miss
+        """
+        try:
+            with open(self._entry_path(html), 'r', encoding='utf-8', newline='') as handle:
+                rst = handle.read()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return rst
+
+    def store(self, html, rst):
+        """
+        Save a conversion. Written to a temp file and renamed so parallel workers never see half an entry.
+        :return:
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(html)
+        tmp_path = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as handle:
+            handle.write(rst)
+        os.replace(tmp_path, path)
+
+
+# One cache per directory per process, so the counters cover a whole batch.
+_pandoc_caches = {}
+
+def get_pandoc_cache(args):
+    """
+    Cache to use for these args, or None when caching is switched off.
+    :return:
+    """
+    if args.no_pandoc_cache or not args.pandoc_cache:
+        return None
+    if args.pandoc_cache not in _pandoc_caches:
+        _pandoc_caches[args.pandoc_cache] = PandocCache(args.pandoc_cache)
+    return _pandoc_caches[args.pandoc_cache]
+
+
+# Conversions done ahead of time for a batch by prerender_help, keyed on the html.
+_prerendered_help = {}
+
+def set_prerendered_help(prerendered):
+    """
+    Load prerendered help, also used as the worker initializer so each process gets the batch's conversions.
+    :return:
+    """
+    _prerendered_help.update(prerendered)
+
+
+# Elements whose end tag a description can leave out without pandoc reading it differently inside a batch.
+_optional_end_tags = frozenset(('p', 'li', 'dt', 'dd'))
+_void_tags = frozenset(('br', 'hr', 'img', 'input', 'meta', 'link', 'area', 'base', 'col', 'embed', 'param',
+                        'source', 'track', 'wbr'))
+_heading_tags = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+
+
+class BatchableHtml(HTMLParser):
+    """
+    Check that a description converts the same inside a batch as on its own: every element is closed, other than
+    ones with an optional end tag (an unclosed <b> or <ul> would carry on into the next description), and no
+    heading or id repeats (pandoc labels the second one, but auto identifiers are off in a batch).
+    """
+    def __init__(self):
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.open = []
+        self.batchable = True
+        self.ids = set()
+        self.heading = None
+
+    def _add_id(self, text):
+        key = re.sub(r'\W+', '', text.lower())
+        if key in self.ids:
+            self.batchable = False
+        self.ids.add(key)
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in _void_tags:
+            self.open.append(tag)
+        element_id = dict(attrs).get('id')
+        if element_id:
+            self._add_id(element_id)
+        elif tag in _heading_tags:
+            # Only headings without an id of their own get one made from their text.
+            self.heading = []
+
+    def handle_data(self, data):
+        if self.heading is not None:
+            self.heading.append(data)
+
+    def handle_endtag(self, tag):
+        if tag in _void_tags:
+            return
+        if tag in _heading_tags and self.heading is not None:
+            self._add_id(''.join(self.heading))
+            self.heading = None
+        while self.open and self.open[-1] != tag and self.open[-1] in _optional_end_tags:
+            self.open.pop()
+        if self.open and self.open[-1] == tag:
+            self.open.pop()
+        else:
+            self.batchable = False
+
+
+def batchable_html(html):
+    """
+    :return: whether html can share a pandoc call with other descriptions
+    """
+    parser = BatchableHtml()
+    parser.feed(html)
+    parser.close()
+    return parser.batchable and all(tag in _optional_end_tags for tag in parser.open)
+
+
+def batch_help_rst(htmls):
+    """
+    Convert several html descriptions with a single pandoc call. A numbered marker paragraph goes after each
+    description and the rst is split back apart on those markers. Automatic heading ids are off, otherwise pandoc
+    would make repeated headings ("Usage") unique across the whole batch and label them.
+    Descriptions batchable_html turns down are converted on their own. If any marker doesn't come back on a line
+    of its own, in order, with nothing trailing the last one (pandoc moves things like image substitutions to
+    the end of the document), or a piece has a label its html doesn't have an id for, every description is
+    converted on its own instead.
+    :return: list of rst strings, in the order of htmls
+    """
+    batched = [html for html in htmls if batchable_html(html)]
+    converted = {}
+    if len(batched) > 1:
+        marker = 'GATK4WRAPSPLIT' + uuid.uuid4().hex
+        html = ''.join('%s\n<p>%s%d</p>\n' % (text, marker, index) for index, text in enumerate(batched))
+        pieces = re.split(r'^%s(\d+)$' % marker,
+                          pypandoc.convert_text(html, 'rst', format='html-auto_identifiers'), flags=re.M)
+        if len(pieces) == 2 * len(batched) + 1 and \
+           pieces[1::2] == [str(index) for index in range(len(batched))] and \
+           not pieces[-1].strip():
+            rsts = [piece.strip('\n') + '\n' for piece in pieces[0:-1:2]]
+            if all(label in text for text, rst in zip(batched, rsts)
+                   for label in re.findall(r'^\.\. _([^:]+):', rst, flags=re.M)):
+                converted = dict(zip(batched, rsts))
+    return [converted[text] if text in converted else pypandoc.convert_text(text, 'rst', format='html')
+            for text in htmls]
+
+
+def prerender_help(args, json_paths):
+    """
+    Convert the descriptions of a batch that need pandoc and aren't already in its cache in one pandoc call, rather
+    than one per tool. Results are stored in the cache when it's enabled.
+    :return: dict of html -> rst
+    """
+    cache = get_pandoc_cache(args)
+    htmls = []
+    for json_path in json_paths:
+        try:
+            with open(json_path, 'r') as myfile:
+                html = json.load(myfile)['description']
+        except (OSError, ValueError, KeyError, TypeError):
+            # Leave it to the conversion itself to report the problem.
+            continue
+        # The built in converter first, so a batch it covers never imports pypandoc for the cache key.
+        if html in htmls or (not args.no_fast_help and fast_help_rst(html) is not None):
+            continue
+        if cache and cache.has(html):
+            continue
+        htmls.append(html)
+    if len(htmls) < 2:
+        return {}
+    prerendered = dict(zip(htmls, batch_help_rst(htmls)))
+    if cache:
+        for html, rst in prerendered.items():
+            cache.store(html, rst)
+    return prerendered
 
 
 class JsonShell(object):
@@ -2570,59 +1059,104 @@ class JsonShell(object):
         self.xml_req_out = []
         self.xml_comm = []
         self.sel_dict = {}
+        # True/False once the help has been looked up in the pandoc cache, None when the cache is off.
+        self.pandoc_cache_hit = None
+        # Wall clock seconds spent in each stage of building this wrapper.
+        self.timings = {}
+        # How the arguments were classified, for --metrics_out.
+        self.counts = {'arguments': 0, 'inputs': 0, 'outputs': 0, 'selects': 0, 'cached': 0}
         with open(args.json, 'r') as myfile:
+            start = time.perf_counter()
             self.json_file = json.load(myfile)
+            self.timings['load'] = time.perf_counter() - start
+            start = time.perf_counter()
             self.shell_dict = self.build_shell_dict()
-            for entry in self.json_file['arguments']:
-                self.my_xml = JsonXml(entry, self.shell_dict['short_name'], args)
-                if self.my_xml.chth:
-                    self.tool_chth.append(self.my_xml.chth)
-                if self.my_xml.chth_pre:
-                    self.pre_chth.append(self.my_xml.chth_pre)
-                if self.my_xml.xml_param and not self.my_xml.is_output and not self.my_xml.is_req_output:
-                    if self.my_xml.section == 'advanced':
-                        self.xml_adv.append(self.my_xml.xml_param)
-                    elif self.my_xml.section == 'optional':
-                        self.xml_opt.append(self.my_xml.xml_param)
-                    elif self.my_xml.section == 'common':
-                        self.xml_comm.append(self.my_xml.xml_param)
-                    elif self.my_xml.section == 'deprecated':
+            self.timings['help'] = time.perf_counter() - start
+            start = time.perf_counter()
+            hits = argument_cache.hits
+            classifier = ToolClassifier(self.shell_dict['short_name'], args)
+            for entry, classified in zip(self.json_file['arguments'], classifier.classify(self.json_file['arguments'])):
+                record = argument_cache.get(entry, self.shell_dict['short_name'], args, classified)
+                self.counts['arguments'] += 1
+                self.counts['inputs'] += bool(record.is_input)
+                self.counts['outputs'] += bool(record.is_output or record.is_req_output)
+                self.counts['selects'] += record.is_select
+                if record.chth:
+                    self.tool_chth.append(record.chth)
+                if record.chth_pre:
+                    self.pre_chth.append(record.chth_pre)
+                if record.xml_param and not record.is_output and not record.is_req_output:
+                    if record.section == 'advanced':
+                        self.xml_adv.append(record.xml_param)
+                    elif record.section == 'optional':
+                        self.xml_opt.append(record.xml_param)
+                    elif record.section == 'common':
+                        self.xml_comm.append(record.xml_param)
+                    elif record.section == 'deprecated':
                         pass
                     else:
-                        self.tool_xml.append(self.my_xml.xml_param)
-                elif self.my_xml.is_output:
-                    self.xml_out.append(self.my_xml.xml_param)
-                elif self.my_xml.is_req_output:
-                    self.xml_req_out.append(self.my_xml.xml_param)
+                        self.tool_xml.append(record.xml_param)
+                elif record.is_output:
+                    self.xml_out.append(record.xml_param)
+                elif record.is_req_output:
+                    self.xml_req_out.append(record.xml_param)
                 else:
                     pass
 
-                if self.my_xml.sel_blob:
-                    self.sel_dict[self.my_xml.pname] = self.my_xml.sel_blob
+                if record.sel_blob:
+                    self.sel_dict[record.pname] = record.sel_blob
+            self.counts['cached'] = argument_cache.hits - hits
+            self.timings['classify'] = time.perf_counter() - start
 
     def build_shell_dict(self):
         """
         This will house all values the templates need.
         :return:
         """
-        shell_dict = {'id': self.json_file['name'].lower().split(' ')[0],
+        shell_dict = {'id': tool_key(self.json_file['name']).lower(),
                       'name': Template('GATK4 $name').substitute(self.json_file),
-                      'short_name': self.json_file['name'].split(' ')[0],
+                      'short_name': tool_key(self.json_file['name']),
                       'profile': self.profile,
                       'description': self.json_file['summary'].rstrip(' '),
-                      'summary': pypandoc.convert_text(self.json_file['description'], 'rst', format='html')}
+                      'summary': self.help_rst(self.json_file['description'])}
         return shell_dict
 
+    def help_rst(self, html):
+        """
+        Convert the html description to rst for the help section. Simple html is converted in process, the rest
+        goes to pandoc through the cache when enabled.
+        :return:
+        """
+        if not self.args.no_fast_help:
+            rst = fast_help_rst(html)
+            if rst is not None:
+                return rst
+        cache = get_pandoc_cache(self.args)
+        if html in _prerendered_help:
+            # Converted up front for the batch, which only happens on a cache miss.
+            if cache:
+                cache.misses += 1
+                self.pandoc_cache_hit = False
+            return _prerendered_help[html]
+        if cache is None:
+            return pypandoc.convert_text(html, 'rst', format='html')
+        rst = cache.lookup(html)
+        self.pandoc_cache_hit = rst is not None
+        if rst is None:
+            rst = pypandoc.convert_text(html, 'rst', format='html')
+            cache.store(html, rst)
+        return rst
+
     def inputs_create(self):
         """
         Arrange the inputs section.
         :return:
         """
         inputs = []
-        for macro in self.my_xml.tool_data[self.shell_dict['short_name']]['pre_params']:
-            inputs.append(self.my_xml.xml_tmpl.substitute(macro_name=macro))
-        for macro in self.my_xml.tool_data[self.shell_dict['short_name']]['post_params']:
-            inputs.append(self.my_xml.xml_tmpl.substitute(macro_name=macro))
+        for macro in Mappings.tool_data[self.shell_dict['short_name']]['pre_params']:
+            inputs.append(XmlTemplates.xml_tmpl.substitute(macro_name=macro))
+        for macro in Mappings.tool_data[self.shell_dict['short_name']]['post_params']:
+            inputs.append(XmlTemplates.xml_tmpl.substitute(macro_name=macro))
 
         return '\n'.join(inputs)
 
@@ -2633,13 +1167,13 @@ class JsonShell(object):
         :return:
         """
         command = []
-        for macro in self.my_xml.tool_data[self.shell_dict['short_name']]['pre_tmpls']:
-            command.append(self.my_xml.chth_tmpl.substitute(macro=macro))
+        for macro in Mappings.tool_data[self.shell_dict['short_name']]['pre_tmpls']:
+            command.append(XmlTemplates.chth_tmpl.substitute(macro=macro))
         command.extend(self.pre_chth)
         command.append(Template('@CMD_BEGIN@ $short_name').substitute(self.shell_dict))
         command.extend(self.tool_chth)
-        for macro in self.my_xml.tool_data[self.shell_dict['short_name']]['post_tmpls']:
-            command.append(self.my_xml.chth_tmpl.substitute(macro=macro))
+        for macro in Mappings.tool_data[self.shell_dict['short_name']]['post_tmpls']:
+            command.append(XmlTemplates.chth_tmpl.substitute(macro=macro))
 
         return '\n'.join(command)
 
@@ -2673,41 +1207,48 @@ class XmlEtrees(JsonShell):
         #        etree.write(stdout, xml_declaration=True, encoding='UTF-8')
         JsonShell.__init__(self, args)
         self.args = args
-        tool = etree.Element('tool', id='gatk4_auto_' + self.shell_dict['id'], name=self.shell_dict['name'],
-                             version="@WRAPPER_VERSION@0", profile=self.profile)
-        description = etree.SubElement(tool, 'description')
+
+    def sections(self):
+        """
+        Build the children of the tool element one at a time, so only one of them is ever held in memory.
+        :return: generator of elements, in document order
+        """
+        description = etree.Element('description')
         description.text = '- ' + self.shell_dict['description']
-        macros = etree.SubElement(tool, 'macros')
+        yield description
+        macros = etree.Element('macros')
         macros_imp = etree.SubElement(macros, 'import')
         macros_imp.text = 'macros.xml'
-        exp_reqs = etree.SubElement(tool, 'expand', macro='requirements')
-        exp_vers = etree.SubElement(tool, 'expand', macro='version_cmd')
-        command = etree.SubElement(tool, 'command', detect_errors='exit_code')
+        yield macros
+        yield etree.Element('expand', macro='requirements')
+        yield etree.Element('expand', macro='version_cmd')
+        command = etree.Element('command', detect_errors='exit_code')
         command.text = etree.CDATA(self.command_create())
+        yield command
 
         # INPUT section
-        self.inputs = etree.SubElement(tool, 'inputs')
-        for entry in self.my_xml.tool_data[self.shell_dict['short_name']]['pre_params']:
+        self.inputs = etree.Element('inputs')
+        for entry in Mappings.tool_data[self.shell_dict['short_name']]['pre_params']:
             etree.SubElement(self.inputs, 'expand', macro=entry)
         self.build_inputs(self.tool_xml, self.inputs, 'param')
-        if self.xml_opt or self.my_xml.tool_data[self.shell_dict['short_name']]['opt_params']:
+        if self.xml_opt or Mappings.tool_data[self.shell_dict['short_name']]['opt_params']:
             self.opt_sect = etree.SubElement(self.inputs, 'section', name='optional', title='Optional Parameters', expanded='False')
             self.build_inputs(self.xml_opt, self.opt_sect, 'param')
-        for entry in self.my_xml.tool_data[self.shell_dict['short_name']]['opt_params']:
+        for entry in Mappings.tool_data[self.shell_dict['short_name']]['opt_params']:
             etree.SubElement(self.opt_sect, 'expand', macro=entry)
 #        self.build_inputs(self.xml_opt, self.opt_sect, 'param')
 
-        if self.xml_adv or self.my_xml.tool_data[self.shell_dict['short_name']]['adv_params']:
+        if self.xml_adv or Mappings.tool_data[self.shell_dict['short_name']]['adv_params']:
 #            self.adv_sect, self.when_yes = self._section_write('advanced', 'Advanced Parameters', 'advanced_sel')
             self.adv_sect = etree.SubElement(self.inputs, 'section', name='advanced', title='Advanced Parameters', expanded='False')
-            for entry in self.my_xml.tool_data[self.shell_dict['short_name']]['adv_params']:
+            for entry in Mappings.tool_data[self.shell_dict['short_name']]['adv_params']:
                 etree.SubElement(self.adv_sect, 'expand', macro=entry)
 #            if not self.args.old_galaxy:
             self.build_inputs(self.xml_adv, self.adv_sect, 'param')
             # else:
             #     self.build_inputs(self.xml_adv, self.when_yes, 'param')
 
-        for entry in self.my_xml.tool_data[self.shell_dict['short_name']]['post_params']:
+        for entry in Mappings.tool_data[self.shell_dict['short_name']]['post_params']:
             etree.SubElement(self.inputs, 'expand', macro=entry)
 
         # Temporary common section to work on macros.
@@ -2726,20 +1267,70 @@ class XmlEtrees(JsonShell):
                 self.build_inputs_out_sel(self.xml_out, self.output_sect)
             else:
                 self.build_inputs_out_sel(self.xml_out, self.inputs)
+        yield self.inputs
+        self.inputs = self.opt_sect = self.adv_sect = self.comm_sect = self.output_sect = None
 
-        self.outputs = etree.SubElement(tool, 'outputs')
-        for entry in self.my_xml.tool_data[self.shell_dict['short_name']]['output_params']:
+        self.outputs = etree.Element('outputs')
+        for entry in Mappings.tool_data[self.shell_dict['short_name']]['output_params']:
             etree.SubElement(self.outputs, 'expand', macro=entry)
         self.build_inputs(self.xml_req_out, self.outputs, 'data')
         self.build_inputs(self.xml_out, self.outputs, 'data', True)
+        yield self.outputs
+        self.outputs = None
 
-        tests = etree.SubElement(tool, 'tests')
-        help = etree.SubElement(tool, 'help')
+        yield etree.Element('tests')
+        help = etree.Element('help')
         help.text = etree.CDATA(self.shell_dict['summary'])
-        citations = etree.SubElement(tool, 'citations')
+        yield help
+        citations = etree.Element('citations')
         exp_cit = etree.SubElement(citations, 'expand', macro='citations')
+        yield citations
 
-        self.to_write = etree.tostring(tool, pretty_print=True, encoding="unicode")
+    def stream_xml(self, handle):
+        """
+        Write the wrapper to a binary file handle a section at a time, laid out the same as
+        etree.tostring(tool, pretty_print=True) would.
+        :return:
+        """
+        tree_seconds = 0.0
+        serialize_seconds = 0.0
+        post_process_seconds = 0.0
+        with etree.xmlfile(handle, encoding='utf-8') as xf:
+            attrib = {'id': 'gatk4_auto_' + self.shell_dict['id'], 'name': self.shell_dict['name'],
+                      'version': '@WRAPPER_VERSION@0', 'profile': self.profile}
+            with xf.element('tool', attrib):
+                xf.write('\n')
+                sections = self.sections()
+                while True:
+                    start = time.perf_counter()
+                    section = next(sections, None)
+                    tree_seconds += time.perf_counter() - start
+                    if section is None:
+                        break
+                    if self.args.post_process:
+                        start = time.perf_counter()
+                        post_parser.clean_tree(section)
+                        post_process_seconds += time.perf_counter() - start
+                    start = time.perf_counter()
+                    # xmlfile doesn't indent nested writes, so lay out the section as the tool's child up front.
+                    etree.indent(section, level=1)
+                    xf.write('  ', section, '\n')
+                    serialize_seconds += time.perf_counter() - start
+        # Nothing can be written outside the root element through xmlfile.
+        handle.write(b'\n')
+        self.timings['tree'] = tree_seconds
+        self.timings['serialize'] = serialize_seconds
+        if self.args.post_process:
+            self.timings['post_process'] = post_process_seconds
+
+    def render(self):
+        """
+        The whole wrapper as a string, for callers that want it in memory rather than in a file.
+        :return:
+        """
+        buffer = io.BytesIO()
+        self.stream_xml(buffer)
+        return buffer.getvalue().decode('utf-8')
 
     def _section_write(self, sname, stitle, selname):
         """
@@ -2823,7 +1414,7 @@ class XmlEtrees(JsonShell):
         Create the output file name for writing, based on input folder.
         :return:
         """
-        self.output_name = [self.args.xml_out, 'gatk4_' + self.json_file['name'].lower().split(' ')[0] + '.xml']
+        self.output_name = [self.args.xml_out, 'gatk4_' + tool_key(self.json_file['name']).lower() + '.xml']
         if not self.args.xml_out.endswith('/'):
             return '/'.join(self.output_name)
         else:
@@ -2831,12 +1422,28 @@ class XmlEtrees(JsonShell):
 
     def write_me(self):
         """
-        Write to file.
+        Write to file. The wrapper is streamed to a temp file next to it and only renamed over the old one once
+        complete, so a tool that fails part way leaves the last good wrapper in place.
         :return:
         """
-        handle_out = open(self.create_output_loc(), 'w')
-        handle_out.write(self.to_write)
-        handle_out.close()
+        # Resolve the lazy lxml import before the clock starts, or the first tool of a run counts it as writing.
+        etree.xmlfile
+        start = time.perf_counter()
+        output = self.create_output_loc()
+        tmp_path = '%s.%d.tmp' % (output, os.getpid())
+        try:
+            with open(tmp_path, 'wb') as handle_out:
+                self.stream_xml(handle_out)
+            os.replace(tmp_path, output)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        # Only the opening, flushing and closing of the file are left over for the write stage.
+        self.timings['write'] = (time.perf_counter() - start - self.timings['tree'] - self.timings['serialize'] -
+                                 self.timings.get('post_process', 0.0))
 
     def build_inputs(self, params, parent, elem, filt_tag=False):
         """
@@ -2845,14 +1452,7 @@ class XmlEtrees(JsonShell):
         """
         for param in params:
 #            if param['optional'] == 'true':
-            this_param = etree.SubElement(parent, elem)
-            for k, v in param.items():
-                if (k == 'min') and (v == ''):
-                    pass
-                elif (k == 'max') and (v == ''):
-                    pass
-                else:
-                    this_param.set(k, v)
+            this_param = etree.SubElement(parent, elem, param)
 
             if param['name'] in self.sel_dict:
                 self.build_sel_opt(this_param, self.sel_dict[param['name']])
@@ -2876,8 +1476,370 @@ class XmlEtrees(JsonShell):
             this_sel = etree.SubElement(this_param, 'option', selected=sel['selected'], value=sel['value'])
             this_sel.text = sel['value']
 
-class PercentTemplate(Template):
-    delimiter = '%'
+def collect_jsons(args):
+    """
+    Gather the json files for a batch run, sorted so the output order is stable between runs.
+    :return:
+    """
+    return sorted(glob.glob(os.path.join(args.json_dir, args.json_glob)))
+
+
+# Kept in --xml_out by --incremental runs, recording what each wrapper was built from.
+MANIFEST_NAME = '.gatk4_wrapper_manifest.json'
+
+
+def tool_fingerprint(args, json_path):
+    """
+    Hashes of everything a wrapper is built from: the json, the tool's tool_data entry along with the gen_in_fmt
+    and gen_out_fmt entries for its arguments, the generator version and the options that change the output.
+    :return: dict, or None if the json can't be read
+    """
+    try:
+        with open(json_path, 'rb') as myfile:
+            raw = myfile.read()
+        json_file = json.loads(raw.decode('utf-8'))
+        tool_name = tool_key(json_file['name'])
+        pnames = set(entry['name'].lstrip('-').replace('-', '_') for entry in json_file['arguments'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    mappings = {'tool_data': Mappings.tool_data.get(tool_name),
+                'gen_in_fmt': {k: v for k, v in Mappings.gen_in_fmt.items() if k in pnames},
+                'gen_out_fmt': {k: v for k, v in Mappings.gen_out_fmt.items() if k in pnames}}
+    return {'json': hashlib.sha256(raw).hexdigest(),
+            'mappings': hashlib.sha256(json.dumps(mappings, sort_keys=True).encode('utf-8')).hexdigest(),
+            'generator': VERSION,
+            'old_galaxy': args.old_galaxy,
+            'post_process': args.post_process}
+
+
+def load_manifest(args):
+    """
+    Read the manifest from the last --incremental run into --xml_out.
+    :return: dict of json path -> {'fingerprint': ..., 'xml': ...}
+    """
+    try:
+        with open(os.path.join(args.xml_out, MANIFEST_NAME), 'r') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(args, manifest):
+    """
+    Write the manifest back, through a rename so an interrupted run can't leave it half written.
+    :return:
+    """
+    path = os.path.join(args.xml_out, MANIFEST_NAME)
+    with open(path + '.tmp', 'w') as handle:
+        json.dump(manifest, handle, indent=1, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+def convert_json(args, json_path):
+    """
+    Build and write the wrapper for a single json file.
+    :return: result dict for the batch summary
+    """
+    tool_args = copy.copy(args)
+    tool_args.json = json_path
+    profiler = None
+    if args.profile_dir:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        myshell = XmlEtrees(tool_args)
+        myshell.write_me()
+    finally:
+        if profiler:
+            profiler.disable()
+    if profiler:
+        os.makedirs(args.profile_dir, exist_ok=True)
+        profiler.dump_stats(os.path.join(args.profile_dir, os.path.splitext(os.path.basename(json_path))[0] + '.pstats'))
+    return {'json': json_path,
+            'xml': myshell.create_output_loc(),
+            'error': None,
+            'skipped': False,
+            'pandoc_cache_hit': myshell.pandoc_cache_hit,
+            'timings': myshell.timings,
+            'counts': myshell.counts,
+            'xml_bytes': os.path.getsize(myshell.create_output_loc())}
+
+
+def convert_json_captured(args, json_path):
+    """
+    Same as convert_json, but hand back any error instead of raising so one bad tool doesn't stop a batch.
+    :return: result dict for the batch summary
+    """
+    try:
+        return convert_json(args, json_path)
+    except Exception as e:
+        return {'json': json_path,
+                'xml': None,
+                'error': '%s: %s' % (type(e).__name__, e),
+                'skipped': False,
+                'pandoc_cache_hit': None,
+                'timings': {},
+                'counts': {},
+                'xml_bytes': None}
+
+
+def run_batch(args):
+    """
+    Convert every json in --json_dir, either in this process or fanned out over --jobs worker processes.
+    Results always come back in the order of collect_jsons, whichever worker finished first.
+    With --incremental, wrappers whose fingerprint matches the manifest and that still exist are skipped.
+    :return: list of result dicts
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    batch_start = time.perf_counter()
+    json_paths = collect_jsons(args)
+    fresh = {}
+    if args.incremental:
+        manifest = load_manifest(args)
+        fingerprints = {json_path: tool_fingerprint(args, json_path) for json_path in json_paths}
+        for json_path in json_paths:
+            entry = manifest.get(json_path)
+            if entry and fingerprints[json_path] and entry['fingerprint'] == fingerprints[json_path] and \
+               os.path.exists(entry['xml']):
+                fresh[json_path] = {'json': json_path,
+                                    'xml': entry['xml'],
+                                    'error': None,
+                                    'skipped': True,
+                                    'pandoc_cache_hit': None,
+                                    'timings': {},
+                                    'counts': {},
+                                    'xml_bytes': None}
+    stale = [json_path for json_path in json_paths if json_path not in fresh]
+
+    # Pandoc runs for the whole batch here, outside every tool's help stage.
+    start = time.perf_counter()
+    prerendered = prerender_help(args, stale)
+    prerender_seconds = time.perf_counter() - start
+    set_prerendered_help(prerendered)
+    jobs = args.jobs or os.cpu_count()
+    if jobs > 1 and len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=set_prerendered_help, initargs=(prerendered,)) as pool:
+            built = list(pool.map(convert_json_captured, [args] * len(stale), stale))
+    else:
+        built = [convert_json_captured(args, json_path) for json_path in stale]
+
+    if args.incremental:
+        for result in built:
+            if result['error']:
+                manifest.pop(result['json'], None)
+            elif fingerprints[result['json']]:
+                manifest[result['json']] = {'fingerprint': fingerprints[result['json']], 'xml': result['xml']}
+        save_manifest(args, manifest)
+
+    built = dict(zip(stale, built))
+    results = [fresh[json_path] if json_path in fresh else built[json_path] for json_path in json_paths]
+    report_batch(results)
+    if args.profile:
+        report_profile(results, prerender_seconds=prerender_seconds, prerendered=len(prerendered))
+    if args.metrics_out:
+        write_metrics(args.metrics_out, results, time.perf_counter() - batch_start,
+                      prerender_seconds=prerender_seconds, prerendered=len(prerendered))
+    return results
+
+
+def report_batch(results):
+    """
+    Print the per-tool outcome of a batch run, followed by the totals.
+    :return:
+    """
+    failed = 0
+    skipped = 0
+    for result in results:
+        if result['error']:
+            failed += 1
+            print('FAIL %s: %s' % (result['json'], result['error']))
+        elif result['skipped']:
+            skipped += 1
+            print('SKIP %s -> %s is up to date' % (result['json'], result['xml']))
+        else:
+            print('OK   %s -> %s' % (result['json'], result['xml']))
+    print('%d converted, %d up to date, %d failed' % (len(results) - failed - skipped, skipped, failed))
+    # Counted from the results rather than the PandocCache, which only sees its own worker process.
+    hits = sum(1 for result in results if result['pandoc_cache_hit'] is True)
+    misses = sum(1 for result in results if result['pandoc_cache_hit'] is False)
+    if hits or misses:
+        print('pandoc cache: %d hits, %d misses' % (hits, misses))
+    arguments = sum(result['counts'].get('arguments', 0) for result in results)
+    if arguments:
+        cached = sum(result['counts'].get('cached', 0) for result in results)
+        print('argument cache: %d of %d arguments reused (%.0f%%)' % (cached, arguments, 100.0 * cached / arguments))
+
+
+def report_profile(results, limit=20, prerender_seconds=None, prerendered=0):
+    """
+    Print the per stage timings of the slowest tools, then each stage's total over all of them, and the batch's
+    own help conversion when there was one.
+    :return:
+    """
+    stages = ('load', 'help', 'classify', 'tree', 'serialize', 'post_process', 'write')
+    timed = [result for result in results if result['timings']]
+    timed.sort(key=lambda result: sum(result['timings'].values()), reverse=True)
+    print('%-40s %9s ' % ('slowest tools (ms)', 'total') + ' '.join('%12s' % stage for stage in stages))
+    for result in timed[:limit]:
+        timings = result['timings']
+        print('%-40s %9.1f ' % (os.path.basename(result['json'])[:40], sum(timings.values()) * 1000) +
+              ' '.join('%12.1f' % (timings.get(stage, 0.0) * 1000) for stage in stages))
+    totals = {stage: sum(result['timings'].get(stage, 0.0) for result in timed) for stage in stages}
+    print('stage totals (ms): ' + ', '.join('%s %.1f' % (stage, totals[stage] * 1000)
+                                            for stage in sorted(stages, key=totals.get, reverse=True)))
+    if prerender_seconds is not None:
+        print('batch help prerender (ms): %.1f for %d descriptions, not in any tool\'s help stage' %
+              (prerender_seconds * 1000, prerendered))
+
+
+def percentile(values, percent):
+    """
+    Nearest rank percentile of a list of numbers.
+    :return:
+    """
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(0, int(-(-percent * len(values) // 100)) - 1)]
+
+
+def peak_rss_kb():
+    """
+    Peak resident memory of this process and of its (waited for) children, such as pool workers and pandoc.
+    :return: kilobytes, or None where the resource module isn't available
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is in bytes on macOS and kilobytes everywhere else.
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def write_metrics(metrics_out, results, wall_seconds, prerender_seconds=0.0, prerendered=0):
+    """
+    Dump per tool metrics and run totals as JSON for the build dashboards. A tool's pandoc_seconds is its own help
+    stage, the pandoc call a batch makes for all of them up front is only in the totals.
+    :return:
+    """
+    tools = []
+    for result in results:
+        timings = result['timings']
+        tools.append({'json': result['json'],
+                      'xml': result['xml'],
+                      'status': 'failed' if result['error'] else 'skipped' if result['skipped'] else 'built',
+                      'error': result['error'],
+                      'arguments': result['counts'].get('arguments'),
+                      'inputs': result['counts'].get('inputs'),
+                      'outputs': result['counts'].get('outputs'),
+                      'selects': result['counts'].get('selects'),
+                      'cached_arguments': result['counts'].get('cached'),
+                      'pandoc_seconds': timings.get('help'),
+                      'generation_seconds': sum(timings.values()) if timings else None,
+                      'xml_bytes': result['xml_bytes'],
+                      'pandoc_cache_hit': result['pandoc_cache_hit']})
+    latencies = [tool['generation_seconds'] for tool in tools if tool['status'] == 'built']
+    built = len(latencies)
+    totals = {'tools': len(tools),
+              'built': built,
+              'skipped': sum(1 for tool in tools if tool['status'] == 'skipped'),
+              'failed': sum(1 for tool in tools if tool['status'] == 'failed'),
+              'wall_seconds': wall_seconds,
+              'tools_per_second': built / wall_seconds if wall_seconds else None,
+              'p50_seconds': percentile(latencies, 50),
+              'p95_seconds': percentile(latencies, 95),
+              'pandoc_cache_hits': sum(1 for tool in tools if tool['pandoc_cache_hit'] is True),
+              'pandoc_cache_misses': sum(1 for tool in tools if tool['pandoc_cache_hit'] is False),
+              'prerender_seconds': prerender_seconds,
+              'prerendered_descriptions': prerendered,
+              'pandoc_seconds': prerender_seconds + sum(tool['pandoc_seconds'] or 0.0 for tool in tools),
+              'xml_bytes': sum(tool['xml_bytes'] or 0 for tool in tools),
+              'peak_rss_kb': peak_rss_kb()}
+    with open(metrics_out, 'w') as handle:
+        json.dump({'generator': VERSION, 'totals': totals, 'tools': tools}, handle, indent=1)
+
+
+def watch_snapshot(args):
+    """
+    What --watch polls: the modification time and size of every json in --json_dir and of tool_data.jsonl.
+    :return: dict of path -> (mtime in ns, size)
+    """
+    snapshot = {}
+    for path in collect_jsons(args) + [Mappings.tool_data.data_file]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def rebuild_changed(args, built, snapshot):
+    """
+    Rebuild the wrappers whose fingerprint differs from the one they were last built from, failed builds included
+    so they are only retried once something they depend on changes.
+    :param built: dict of json path -> fingerprint, updated in place
+    :param snapshot: watch_snapshot taken before looking for changes
+    :return: list of result dicts for the rebuilt wrappers
+    """
+    json_paths = collect_jsons(args)
+    for json_path in set(built) - set(json_paths):
+        del built[json_path]
+    fingerprints = {}
+    for json_path in json_paths:
+        # A json that can't be read only needs another try once the file itself changes.
+        fingerprints[json_path] = tool_fingerprint(args, json_path) or {'unreadable': snapshot.get(json_path)}
+    stale = [json_path for json_path in json_paths if fingerprints[json_path] != built.get(json_path)]
+    set_prerendered_help(prerender_help(args, stale))
+    results = []
+    for json_path in stale:
+        start = time.perf_counter()
+        result = convert_json_captured(args, json_path)
+        built[json_path] = fingerprints[json_path]
+        if result['error']:
+            print('FAIL %s: %s' % (json_path, result['error']))
+        else:
+            print('OK   %s -> %s %.0f ms' % (json_path, result['xml'], (time.perf_counter() - start) * 1000))
+        results.append(result)
+    return results
+
+
+def watch(args):
+    """
+    Keep the mappings, templates and pandoc cache loaded and rebuild only the affected wrappers whenever a json
+    or tool_data.jsonl changes, until interrupted. Changes to the mappings in this file need a restart.
+    With --incremental, wrappers the manifest already has up to date aren't rebuilt on start, and the manifest
+    is kept current.
+    :return:
+    """
+    built = {}
+    if args.incremental:
+        manifest = load_manifest(args)
+        built = {json_path: entry['fingerprint'] for json_path, entry in manifest.items() if os.path.exists(entry['xml'])}
+    previous = None
+    print('Watching %s and %s, Ctrl-C to stop' % (os.path.join(args.json_dir, args.json_glob), Mappings.tool_data.data_file))
+    try:
+        while True:
+            current = watch_snapshot(args)
+            if current != previous:
+                data_file = Mappings.tool_data.data_file
+                if previous is not None and current.get(data_file) != previous.get(data_file):
+                    Mappings.tool_data.reload()
+                results = rebuild_changed(args, built, current)
+                if results and args.incremental:
+                    for result in results:
+                        if result['error']:
+                            manifest.pop(result['json'], None)
+                        else:
+                            manifest[result['json']] = {'fingerprint': built[result['json']], 'xml': result['xml']}
+                    save_manifest(args, manifest)
+                previous = current
+            time.sleep(args.watch_interval)
+    except KeyboardInterrupt:
+        print('Stopped watching')
 
 
 def main():
@@ -2890,8 +1852,22 @@ def main():
     :return:
     """
     args = supply_args()
-    myshell = XmlEtrees(args)
-    myshell.write_me()
+    if args.watch:
+        watch(args)
+    elif args.json_dir:
+        results = run_batch(args)
+        if any(result['error'] for result in results):
+            sys.exit(1)
+    elif args.profile or args.profile_dir or args.metrics_out:
+        start = time.perf_counter()
+        results = [convert_json(args, args.json)]
+        if args.profile:
+            report_profile(results)
+        if args.metrics_out:
+            write_metrics(args.metrics_out, results, time.perf_counter() - start)
+    else:
+        myshell = XmlEtrees(args)
+        myshell.write_me()
 
 if __name__ == "__main__":
     main()
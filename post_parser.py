@@ -1,102 +1,216 @@
 """Remove the unnecessary cheeta codes"""
 
+import argparse
+import glob
+import os
+import re
 import sys
+import time
 
-def main(file_name):
-  #open the wrapper
-  wrapper_file = open(file_name, 'r')
-  #get the first line to find the name
-  first_line = wrapper_file.readline()
-  #make a default name in case somthing goes wrong
-  new_file_name = first_line
-  #find the name of the tool and create the name of the wrapper
-  if '"' in first_line:
-    new_file_name = first_line.split('"')[1] + "_post.xml"
-  #print the new wrapper name
-  print(new_file_name)
-  #create and open the file
-  new_wrapper = open(new_file_name, 'w')
-  #write the first line to the new file
-  new_wrapper.write(first_line)
-  #the list of arguments that are in the macros and need to be removed from the cheetah section
-  arguments = ["version", "showHidden", "help", "arguments_file", "VERBOSITY", "verbosity", "gatk_config_file", "gcs_max_retries", "use_jdk_deflater", "use_jdk_inflater", "interval_merging_rule", "interval_set_rule", "disable_read_filter", "disable_tool_default_read_filters", "read_filter", "create_output_variant_index", "add_output_sam_program_record", "add_output_vcf_command_line", "create_output_bam_index", "create_output_bam_md5", "create_output_variant_md5", "VALIDATION_STRINGENCY", "USE_JDK_INFLATER", "USE_JDK_DEFLATER", "TMP_DIR", "QUIET", "MAX_RECORDS_IN_RAM", "GA4GH_CLIENT_SECRETS", "CREATE_MD5_FILE", "CREATE_INDEX", "COMPRESSION_LEVEL", "REFERENCE_SEQUENCE", "OUTPUT", "SEQUENCE_DICTIONARY", "INPUT", "input", "reference", "output", "annotation", "annotation_group", "annotations_to_exclude", "intervals", "exclude_intervals", "read_index", "interval_padding", "interval_exclusion_padding", "output_prefix", "sequence_dictionary", "variant"]
-  #initate the count to the high number
-  count = 3
-  #initate us outside the cheetah section
-  in_cheetah = False
-  #initiate the last line to an empty string
-  last_line = ""
-  #initiate keep_last to false so we don't prin the empty string
-  keep_last = False
-  #Loop over the wrapper file
-  for line in wrapper_file:
-    #initate keep to false
-    keep = False
-    # check if we are leaving the cheetah section
-    if "<inputs>" in line:
-      in_cheetah = False
-    #check if we are in the cheetah section
-    if in_cheetah:
-      #loop over each argument in teh list of arguments to remove
-      for argument in arguments:
-        #find if the argument is in this line
-        if "." + argument in line:
-          #if the argument is in the line then set the count to remove this line and the next
-          count = 1
-      #if we are two away from a line with an argument then turn keep to true
-      if count == 3:
-        keep = True
-      else:
-        #if we aren't far enough away increase the count to one farther away
-        count += 1
-      if line.startswith("$"):
-        #if the line starts with $ then it is a boolean and the line before and after should be removed so 
-        #set the keep_last to false
-        keep_last = False
-        #set the count to 2 to get rid of the next one
-        count = 2
+#the arguments that are in the macros and need to be removed from the cheetah section, parse_gatk_json.py
+#leaves these to the macros too (Mappings.common_args)
+MACRO_ARGUMENTS = ("version", "showHidden", "help", "arguments_file", "VERBOSITY", "verbosity", "gatk_config_file",
+                   "gcs_max_retries", "use_jdk_deflater", "use_jdk_inflater", "interval_merging_rule",
+                   "interval_set_rule", "disable_read_filter", "disable_tool_default_read_filters", "read_filter",
+                   "create_output_variant_index", "add_output_sam_program_record", "add_output_vcf_command_line",
+                   "create_output_bam_index", "create_output_bam_md5", "create_output_variant_md5",
+                   "VALIDATION_STRINGENCY", "USE_JDK_INFLATER", "USE_JDK_DEFLATER", "TMP_DIR", "QUIET",
+                   "MAX_RECORDS_IN_RAM", "GA4GH_CLIENT_SECRETS", "CREATE_MD5_FILE", "CREATE_INDEX",
+                   "COMPRESSION_LEVEL", "REFERENCE_SEQUENCE", "OUTPUT", "SEQUENCE_DICTIONARY", "INPUT",
+                   "input", "reference", "output", "annotation", "annotation_group", "annotations_to_exclude",
+                   "intervals", "exclude_intervals", "read_index", "interval_padding",
+                   "interval_exclusion_padding", "output_prefix", "sequence_dictionary", "variant")
+#matches "." followed by any of the arguments anywhere in a line, so one search replaces a substring scan per argument
+macro_argument_re = re.compile(r"\.(?:" + "|".join(re.escape(argument) for argument in MACRO_ARGUMENTS) + ")")
+
+#a cheetah block directive line: group 1 opens a block, group 2 carries on an #if, group 3 closes a block
+block_directive_re = re.compile(r"[ \t]*#(?:(if|for)|(else|elif)|end[ \t]+(if|for))\b")
+#an #if around nothing but a line starting with $, which is how boolean arguments come out
+boolean_block_re = re.compile(r"\n[ \t]*#if\b[^\n]*\n(\$[^\n]*)\n[ \t]*#end[ \t]+if[ \t]*(?=\n|$)")
+
+def match_lines(pattern, text):
+  """Search the whole text at once rather than line by line, yielding the line index of each match with the match"""
+  index = 0
+  last = 0
+  for match in pattern.finditer(text):
+    index += text.count("\n", last, match.start())
+    last = match.start()
+    yield index, match
+
+def block_end(lines, start):
+  """Find the line that closes the block opened on lines[start]"""
+  open_blocks = [block_directive_re.match(lines[start]).group(1)]
+  for index in range(start + 1, len(lines)):
+    directive = block_directive_re.match(lines[index])
+    if directive:
+      opened, branch, closed = directive.groups()
+      if opened:
+        open_blocks.append(opened)
+      elif closed:
+        if open_blocks.pop() != closed:
+          raise ValueError("unmatched #end %s on command line %d" % (closed, index + 1))
+        if not open_blocks:
+          return index
+  raise ValueError("#%s on command line %d is never closed" % (open_blocks[0], start + 1))
+
+def is_if_line(line):
+  directive = block_directive_re.match(line)
+  return directive is not None and directive.group(1) == "if"
+
+def is_end_if_line(line):
+  directive = block_directive_re.match(line)
+  return directive is not None and directive.group(3) == "if"
+
+def clean_command_text(text):
+  """Drop the cheetah blocks for arguments the macros cover and unwrap the #if around boolean arguments"""
+  lines = text.split("\n")
+  dropped = set()
+  #last line of the block we last dropped, nothing inside it needs another look
+  done_until = -1
+  #only the lines with a macro argument are looked at, and the blocks they open
+  for index, _ in match_lines(macro_argument_re, text):
+    if index <= done_until:
+      continue
+    directive = block_directive_re.match(lines[index])
+    if directive and directive.group(1):
+      #a block that opens on a macro argument goes as a whole
+      done_until = block_end(lines, index)
+    elif directive:
+      raise ValueError("macro argument in a block directive on command line %d" % (index + 1))
+    elif 0 < index < len(lines) - 1 and is_if_line(lines[index - 1]) and is_end_if_line(lines[index + 1]):
+      #the line was all its #if held, so the #if goes with it
+      dropped.add(index - 1)
+      done_until = index + 1
     else:
-      #if we are not in the cheetah section then keep the line
-      keep = True
-      #check if we are entering the cheetah section
-      if "<command detect_errors" in line:
-        in_cheetah = True
-    #check if we are suppose to keep the last line and then write it if so
-    if keep_last:
-      new_wrapper.write(last_line)
-    #check if we are in a boolean param
-    if 'type="boolean"' in line:
-      #check if we are in an improperly formatted default true boolean
-      if 'checked="true"' in line and 'truevalue=""' not in line:
-        #split the line by "
-        line_split = line.split('"')
-        #get the truevalue, add false to it and assing it to falsevalue
-        new_false = line_split[7]
-        line_split[7] = ""
-        line_split[9] = new_false + " false"
-        #initate the newline and put the split back together
-        new_line = ""
-        #initate a First check
-        first = True
-        for spot in line_split:
-          # if first then skip the " and mark as no longer first
-          if first:
-            new_line = spot
-            first = False
-          else:
-            #add the next spot and a "
-            new_line += '"' + spot
-          #assign the remade line to teh line
-          line = new_line
-    #remember the last line and it's keep status for the next interation. 
-    last_line = line
-    keep_last = keep
-  #write the last line
-  new_wrapper.write(last_line)
-  #close the files
-  wrapper_file.close()
+      done_until = index
+    dropped.update(range(index, done_until + 1))
+  if dropped:
+    text = "\n".join([line for index, line in enumerate(lines) if index not in dropped])
+  #booleans print their own value (truevalue or falsevalue), so they don't need the #if around them
+  return boolean_block_re.sub(r"\n\1", "\n" + text)[1:]
+
+def clean_command(command):
+  """Clean up the cheetah of a <command> element in place"""
+  from lxml import etree
+  command.text = etree.CDATA(clean_command_text(command.text or ""))
+
+def fix_booleans(element):
+  """Flip the default true booleans under element (itself included) so that leaving them checked doesn't add
+  anything to the command line and unchecking them passes "<argument> false" """
+  for param in element.xpath('descendant-or-self::param[@type="boolean"][@checked="true"][@truevalue!=""]'):
+    param.set("falsevalue", param.get("truevalue") + " false")
+    param.set("truevalue", "")
+
+def clean_tree(element):
+  """Clean up a wrapper tree, or any part of one, in place"""
+  for command in element.iter("command"):
+    clean_command(command)
+  fix_booleans(element)
+
+def clean_wrapper(text):
+  """Clean up the text of a whole wrapper"""
+  from lxml import etree
+  root = etree.fromstring(text, etree.XMLParser(strip_cdata=False))
+  clean_tree(root)
+  return etree.tostring(root, encoding="unicode") + "\n"
+
+class NotAWrapper(Exception):
+  """Raised for xml files that aren't tool wrappers, like the macros.xml next to them"""
+
+def post_process_file(file_name, out_dir=None):
+  """Clean up one wrapper and write it as <tool id>_post.xml, next to it or into out_dir"""
+  from lxml import etree
+  #time each step for the report
+  timings = {}
+  start = time.perf_counter()
+  #read the wrapper in to a tree
+  wrapper = etree.parse(file_name, etree.XMLParser(strip_cdata=False))
+  timings["read"] = time.perf_counter() - start
+  #other xml in a tool folder, such as macros.xml, is left alone
+  if wrapper.getroot().tag != "tool":
+    raise NotAWrapper("root element is <%s>, not <tool>" % wrapper.getroot().tag)
+  #without a tool id there is no name to write to, so report the wrapper as failed
+  tool_id = wrapper.getroot().get("id")
+  if not tool_id:
+    raise ValueError("no tool id")
+  #create the name of the wrapper
+  new_file_name = os.path.join(os.path.dirname(file_name) if out_dir is None else out_dir, tool_id + "_post.xml")
+  #clean up the tree
+  start = time.perf_counter()
+  clean_tree(wrapper.getroot())
+  timings["clean"] = time.perf_counter() - start
+  #create and open the file and write the cleaned up wrapper
+  start = time.perf_counter()
+  new_wrapper = open(new_file_name, 'w')
+  new_wrapper.write(etree.tostring(wrapper, encoding="unicode") + "\n")
   new_wrapper.close()
-  
+  timings["write"] = time.perf_counter() - start
+  return new_file_name, timings
+
+def post_process_captured(file_name, out_dir=None):
+  """Same as post_process_file, but hand back any error instead of raising so one bad wrapper doesn't stop the rest"""
+  start = time.perf_counter()
+  new_file_name, timings, error, skipped = None, {}, None, None
+  try:
+    new_file_name, timings = post_process_file(file_name, out_dir)
+  except NotAWrapper as e:
+    skipped = str(e)
+  except Exception as e:
+    error = "%s: %s" % (type(e).__name__, e)
+  return {"xml": file_name, "post": new_file_name, "error": error, "skipped": skipped, "timings": timings,
+          "seconds": time.perf_counter() - start}
+
+def expand_wrappers(paths):
+  """Folders on the command line stand for every wrapper in them, leaving out earlier _post.xml results"""
+  file_names = []
+  for path in paths:
+    if os.path.isdir(path):
+      file_names.extend(name for name in sorted(glob.glob(os.path.join(path, "*.xml")))
+                        if not name.endswith("_post.xml"))
+    else:
+      file_names.append(path)
+  return file_names
+
+def supply_args():
+  parser = argparse.ArgumentParser(description="Remove the cheetah code the macros already cover from GATK4 wrappers")
+  parser.add_argument("xml", nargs="+", help="Wrappers, or folders of them")
+  parser.add_argument("--out_dir", help="Write the _post.xml files here instead of next to each wrapper")
+  parser.add_argument("--jobs", type=int, default=1, help="Worker processes, 0 uses every CPU")
+  parser.add_argument("--profile", action="store_true", help="Print the read, clean and write time of each wrapper")
+  return parser.parse_args()
+
+def main():
+  args = supply_args()
+  file_names = expand_wrappers(args.xml)
+  if args.out_dir:
+    os.makedirs(args.out_dir, exist_ok=True)
+  jobs = args.jobs or os.cpu_count()
+  start = time.perf_counter()
+  if jobs > 1 and len(file_names) > 1:
+    #only pull in the process pool when it is used
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+      results = list(pool.map(post_process_captured, file_names, [args.out_dir] * len(file_names)))
+  else:
+    results = [post_process_captured(file_name, args.out_dir) for file_name in file_names]
+  failed = 0
+  skipped = 0
+  for result in results:
+    if result["error"]:
+      failed += 1
+      print("FAIL %s: %s" % (result["xml"], result["error"]))
+    elif result["skipped"]:
+      skipped += 1
+      print("SKIP %s: %s" % (result["xml"], result["skipped"]))
+    else:
+      print("OK   %s -> %s %.1f ms" % (result["xml"], result["post"], result["seconds"] * 1000))
+      #print the timings in ms
+      if args.profile:
+        print("     " + ", ".join("%s %.1f ms" % (step, seconds * 1000) for step, seconds in result["timings"].items()))
+  print("%d cleaned, %d skipped, %d failed in %.2fs" % (len(results) - failed - skipped, skipped, failed,
+                                                       time.perf_counter() - start))
+  if failed:
+    sys.exit(1)
+
 if __name__ == "__main__":
-    args = sys.argv
-    main(args[1])
\ No newline at end of file
+  main()
@@ -0,0 +1,129 @@
+"""Per tool configuration for the GATK4 wrappers, kept in tool_data.jsonl and read one tool at a time"""
+
+import json
+import os
+import re
+
+# One tool per line, {"tool": name, ...entry}, with the tool key written first so lines can be indexed without
+# parsing them.
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tool_data.jsonl')
+# The keys every entry has, in the order they are written.
+ENTRY_KEYS = ('output_fmt', 'input_fmt', 'pre_tmpls', 'post_tmpls', 'pre_params', 'opt_params', 'adv_params',
+              'post_params', 'output_params')
+
+_tool_line = re.compile(r'\{"tool": "((?:[^"\\]|\\.)*)"')
+
+
+def tool_key(name):
+    """
+    The tool_data key for the name in a GATK json: its first word, so "FilterVcf (Picard)" and
+    "HaplotypeCallerSpark **BETA**" are filed as FilterVcf and HaplotypeCallerSpark.
+    :return:
+    """
+    return name.split(' ')[0]
+
+
+class ToolData(object):
+    """
+    Dict like access to tool_data.jsonl. The file is only indexed (tool name -> line) on first use, and an entry
+    is only parsed when that tool is asked for. Entries set on an instance stay in memory, use save() to change
+    the file.
+    """
+    def __init__(self, data_file=DATA_FILE):
+        self.data_file = data_file
+        self._lines = None
+        self._entries = {}
+
+    def _line_tool(self, line, line_number):
+        """
+        The tool a line of the data file is for. Lines written by save() are matched without parsing them, hand
+        edited ones that don't start exactly with {"tool": "...", are parsed.
+        :return: tool name, or None for a blank line
+        """
+        match = _tool_line.match(line)
+        if match:
+            return json.loads('"%s"' % match.group(1))
+        if not line.strip():
+            return None
+        try:
+            return json.loads(line)['tool']
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError('%s line %d has no tool name: %s: %s' % (self.data_file, line_number,
+                                                                     type(e).__name__, e))
+
+    def _index(self):
+        """
+        Map each tool name to its raw line.
+        :return:
+        """
+        if self._lines is None:
+            lines = {}
+            with open(self.data_file, 'r') as handle:
+                for line_number, line in enumerate(handle, 1):
+                    tool = self._line_tool(line, line_number)
+                    if tool is not None:
+                        lines[tool] = line
+            self._lines = lines
+        return self._lines
+
+    def __getitem__(self, tool):
+        if tool not in self._entries:
+            entry = json.loads(self._index()[tool])
+            del entry['tool']
+            self._entries[tool] = entry
+        return self._entries[tool]
+
+    def __setitem__(self, tool, entry):
+        self._entries[tool] = entry
+
+    def __contains__(self, tool):
+        return tool in self._entries or tool in self._index()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def keys(self):
+        """
+        Tool names, in file order followed by any set in memory only.
+        :return:
+        """
+        names = list(self._index())
+        return names + [tool for tool in self._entries if tool not in self._index()]
+
+    def get(self, tool, default=None):
+        return self[tool] if tool in self else default
+
+    def reload(self):
+        """
+        Forget the index and every entry, so the next lookup reads the data file again. Entries only set in
+        memory are dropped too.
+        :return:
+        """
+        self._lines = None
+        self._entries = {}
+
+    def save(self, tool, entry):
+        """
+        Add or replace a tool's line in the data file, keeping the position of an existing entry.
+        :return:
+        """
+        new_line = json.dumps(dict([('tool', tool)] + [(key, entry[key]) for key in ENTRY_KEYS])) + '\n'
+        lines = []
+        replaced = False
+        if os.path.exists(self.data_file):
+            with open(self.data_file, 'r') as handle:
+                for line_number, line in enumerate(handle, 1):
+                    if self._line_tool(line, line_number) == tool:
+                        line = new_line
+                        replaced = True
+                    lines.append(line)
+        if not replaced:
+            lines.append(new_line)
+        with open(self.data_file + '.tmp', 'w') as handle:
+            handle.writelines(lines)
+        os.replace(self.data_file + '.tmp', self.data_file)
+        self._lines = None
+        self._entries[tool] = entry